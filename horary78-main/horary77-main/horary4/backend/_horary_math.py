@@ -14,10 +14,65 @@ Created for computational functions used in horary judgment
 """
 
 import math
+import bisect
 import datetime
-from typing import Tuple, Optional, Dict, Any
+import functools
+from typing import Tuple, Optional, Dict, Any, Sequence
+import numpy as np
 import swisseph as swe
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional - kernels run as plain Python without it
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Classical civil twilight threshold used in traditional astrology (degrees)
+CIVIL_TWILIGHT_ALTITUDE = -8.0
+
+# Condition codes returned by solar_condition_core, in order of precedence
+SOLAR_FREE = 0
+SOLAR_CAZIMI = 1
+SOLAR_COMBUSTION = 2
+SOLAR_UNDER_BEAMS = 3
+
+# Timing descriptions: bisect_right(_TIMING_EDGES, days) picks (template, unit in days)
+_TIMING_EDGES = (0.5, 1.0, 7.0, 30.0, 365.0)
+_TIMING_FORMATS = (
+    ("Within hours", None),
+    ("Within a day", None),
+    ("Within {} days", 1),
+    ("Within {} weeks", 7),
+    ("Within {} months", 30),
+    ("More than a year", None),
+)
+
+
+@functools.lru_cache(maxsize=16384)
+def _cached_calc_ut(jd_ut: float, planet_id: int, flags: int) -> Tuple[float, ...]:
+    planet_data, _ = swe.calc_ut(jd_ut, planet_id, flags)
+    return tuple(planet_data)
+
+
+def calc_ut_cached(jd_ut: float, planet_id: int,
+                   flags: int = swe.FLG_SWIEPH | swe.FLG_SPEED) -> Tuple[float, ...]:
+    """
+    Memoized Swiss Ephemeris position lookup.
+    
+    Args:
+        jd_ut: Julian Day (UT)
+        planet_id: Swiss Ephemeris planet ID
+        flags: Swiss Ephemeris calculation flags
+    
+    Returns:
+        Tuple of (longitude, latitude, distance, lon_speed, lat_speed, dist_speed)
+    """
+    return _cached_calc_ut(jd_ut, planet_id, flags)
+
 
 def calculate_next_station_time(planet_id: int, jd_start: float, 
                                max_days: int = 365) -> Optional[float]:
@@ -75,21 +130,25 @@ def calculate_next_station_time(planet_id: int, jd_start: float,
 def _refine_station_time(planet_id: int, jd_before: float, jd_after: float) -> float:
     """Refine station time to higher precision using binary search"""
     tolerance = 0.001  # About 1.5 minutes
+    flags = swe.FLG_SWIEPH | swe.FLG_SPEED
+    
+    try:
+        speed_before = swe.calc_ut(jd_before, planet_id, flags)[0][3]
+    except Exception:
+        return (jd_before + jd_after) / 2
     
     while (jd_after - jd_before) > tolerance:
         jd_mid = (jd_before + jd_after) / 2
         
         try:
-            data_before, _ = swe.calc_ut(jd_before, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-            data_mid, _ = swe.calc_ut(jd_mid, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-            
-            speed_before = data_before[3]
-            speed_mid = data_mid[3]
+            # Only the midpoint is new; the lower bound's speed is carried over
+            speed_mid = swe.calc_ut(jd_mid, planet_id, flags)[0][3]
             
             # Check which side of midpoint the station is on
             if (speed_before > 0 and speed_mid > 0) or (speed_before < 0 and speed_mid < 0):
                 # Station is after midpoint
                 jd_before = jd_mid
+                speed_before = speed_mid
             else:
                 # Station is before midpoint
                 jd_after = jd_mid
@@ -189,6 +248,141 @@ def days_to_sign_exit(longitude: float, speed: float) -> Optional[float]:
     return degrees_to_boundary / abs(speed)
 
 
+@njit(cache=True)
+def _days_to_sign_exit_core(longitude: float, speed: float) -> float:
+    """Days until sign exit for a moving planet, inside the kernels (see days_to_sign_exit)"""
+    direction = 1 if speed > 0 else -1
+    
+    # Next sign boundary in the direction of motion
+    current_longitude = wrap360(longitude)
+    current_sign_start = (int(current_longitude // 30)) * 30
+    if direction > 0:
+        boundary_longitude = current_sign_start + 30
+        if boundary_longitude >= 360:
+            boundary_longitude = 0
+    else:
+        boundary_longitude = current_sign_start
+        if current_longitude == current_sign_start:  # Exactly on boundary
+            boundary_longitude = current_sign_start - 30
+            if boundary_longitude < 0:
+                boundary_longitude = 330
+    
+    # Calculate degrees to boundary
+    if direction > 0:  # Direct motion
+        if boundary_longitude > longitude:
+            degrees_to_boundary = boundary_longitude - longitude
+        else:  # Crossing 0° Aries
+            degrees_to_boundary = (360 - longitude) + boundary_longitude
+    else:  # Retrograde motion
+        if boundary_longitude < longitude:
+            degrees_to_boundary = longitude - boundary_longitude
+        else:  # Crossing from Aries to Pisces
+            degrees_to_boundary = longitude + (360 - boundary_longitude)
+    
+    return degrees_to_boundary / abs(speed)
+
+
+@njit(cache=True)
+def wrap360(angle: float) -> float:
+    """Normalize an angle to the 0..360 range with a single floor"""
+    return angle - 360.0 * math.floor(angle / 360.0)
+
+
+@njit(cache=True)
+def wrap180(angle: float) -> float:
+    """Normalize an angle to the -180..+180 range without looping"""
+    return angle - 360.0 * math.floor((angle + 180.0) / 360.0)
+
+
+@njit(cache=True)
+def angular_separation(lon1: float, lon2: float) -> float:
+    """Shortest angular distance between two longitudes (0-180)"""
+    return abs(wrap180(lon1 - lon2))
+
+
+@njit(cache=True)
+def house_positions_core(longitudes: np.ndarray, cusps: np.ndarray) -> np.ndarray:
+    """
+    House number (1-12) of each longitude.
+    
+    Measured from the Ascendant, the cusps form an ascending sequence in
+    0-360 starting at 0, so a binary search on the longitude's offset gives
+    the house directly, including the house that crosses 0° Aries.
+    """
+    ascendant = cusps[0]
+    # Whole-array wrap360, so the kernel stays fast when Numba is not installed
+    offsets = cusps - ascendant
+    offsets = offsets - 360.0 * np.floor(offsets / 360.0)
+    longitude_offsets = longitudes - ascendant
+    longitude_offsets = longitude_offsets - 360.0 * np.floor(longitude_offsets / 360.0)
+    return np.searchsorted(offsets, longitude_offsets, side='right').astype(np.int64)
+
+
+def house_position(longitude: float, cusps: Sequence[float]) -> int:
+    """
+    House number (1-12) of one longitude, by the same rule as house_positions_core.
+    
+    Plain Python: for a single lookup this is faster than building arrays for
+    the kernel, with or without Numba.
+    """
+    ascendant = cusps[0]
+    angle = longitude - ascendant
+    offset = angle - 360.0 * math.floor(angle / 360.0)
+    for house in range(1, 12):
+        angle = cusps[house] - ascendant
+        if offset < angle - 360.0 * math.floor(angle / 360.0):
+            return house
+    return 12
+
+
+@njit(cache=True)
+def _interval_core(transitions: np.ndarray, utc: int) -> int:
+    # Index of the transition interval containing a UTC instant (seconds)
+    i = np.searchsorted(transitions, utc, side='right') - 1
+    return i if i > 0 else 0
+
+
+@njit(cache=True)
+def localize_offsets_core(transitions: np.ndarray, offsets: np.ndarray, dst: np.ndarray,
+                          local: np.ndarray) -> np.ndarray:
+    """
+    UTC offset (seconds) of each naive local time (epoch seconds), resolved as
+    pytz's localize(is_dst=False) over a zone's transition table.
+    
+    As pytz does, the intervals a day either side are the candidates, kept when
+    their offset maps the wall time back onto itself. Ambiguous times take the
+    standard-time reading (else the later by UTC); non-existent ones take the
+    offset in force six hours earlier.
+    """
+    result = np.empty(local.shape[0], dtype=np.int64)
+    for n in range(local.shape[0]):
+        wall = local[n]
+        while True:
+            k0 = _interval_core(transitions, wall - 86400)
+            k1 = _interval_core(transitions, wall + 86400)
+            utc0 = wall - offsets[k0]
+            utc1 = wall - offsets[k1]
+            i0 = _interval_core(transitions, utc0)
+            i1 = _interval_core(transitions, utc1)
+            valid0 = offsets[i0] == offsets[k0]
+            valid1 = offsets[i1] == offsets[k1]
+            if valid0 or valid1:
+                break
+            wall -= 6 * 3600
+        
+        if not valid0:
+            take_second = True
+        elif valid1 and utc0 != utc1:
+            if dst[i0] != dst[i1]:
+                take_second = not dst[i1]
+            else:
+                take_second = utc1 > utc0
+        else:
+            take_second = False
+        result[n] = offsets[k1] if take_second else offsets[k0]
+    return result
+
+
 def calculate_elongation(planet_longitude: float, sun_longitude: float) -> float:
     """
     Calculate elongation (angular distance) between planet and Sun.
@@ -245,19 +439,9 @@ def sun_altitude_at_civil_twilight(latitude: float, longitude: float,
     
     Classical source: Al-Biruni - planetary visibility and heliacal risings
     """
-    try:
-        # Calculate Sun position
-        sun_data, _ = swe.calc_ut(jd_ut, swe.SUN, swe.FLG_SWIEPH)
-        sun_longitude = sun_data[0]
-        sun_latitude = sun_data[1]
-        
-        # Convert to horizontal coordinates would require more complex calc
-        # For simplicity, approximate using -8° as civil twilight threshold
-        # This is the classical threshold used in traditional astrology
-        return -8.0  # Standard civil twilight altitude
-        
-    except Exception:
-        return -8.0  # Default to civil twilight
+    # Callers only compare against the classical threshold, so no Sun
+    # position or horizontal-coordinate calculation is needed
+    return CIVIL_TWILIGHT_ALTITUDE
 
 
 def calculate_moon_variable_speed(jd_ut: float) -> float:
@@ -273,7 +457,7 @@ def calculate_moon_variable_speed(jd_ut: float) -> float:
     Classical source: Lilly III Chap. XXV - Moon's variable motion in timing
     """
     try:
-        moon_data, _ = swe.calc_ut(jd_ut, swe.MOON, swe.FLG_SWIEPH | swe.FLG_SPEED)
+        moon_data = calc_ut_cached(jd_ut, swe.MOON)
         return abs(moon_data[3])  # Return absolute speed
     except Exception:
         return 13.0  # Classical average fallback
@@ -299,18 +483,14 @@ def check_aspect_separation_order(planet_a_lon: float, planet_a_speed: float,
     Classical source: Lilly III Chap. XXVI - Translation of Light
     """
     # Calculate current aspect angle
-    current_angle = abs(planet_a_lon - planet_c_lon)
-    if current_angle > 180:
-        current_angle = 360 - current_angle
+    current_angle = angular_separation(planet_a_lon, planet_c_lon)
     
     # Calculate future angle (1 hour ahead)
     future_jd = jd_current + (1.0 / 24.0)  # 1 hour
     future_a_lon = (planet_a_lon + planet_a_speed * (1.0 / 24.0)) % 360
     future_c_lon = (planet_c_lon + planet_c_speed * (1.0 / 24.0)) % 360
     
-    future_angle = abs(future_a_lon - future_c_lon)
-    if future_angle > 180:
-        future_angle = 360 - future_angle
+    future_angle = angular_separation(future_a_lon, future_c_lon)
     
     # Current orb from exact aspect
     current_orb = abs(current_angle - aspect_degrees)
@@ -327,11 +507,106 @@ def check_aspect_separation_order(planet_a_lon: float, planet_a_speed: float,
     }
 
 
+@njit(cache=True)
+def is_applying_core(lon1: float, speed1: float, lon2: float, speed2: float,
+                     aspect_degrees: float, time_increment: float) -> bool:
+    """
+    Numeric core of the applying check between two planets.
+    
+    The faster planet applies to the slower one; the aspect only applies if
+    it perfects before either planet leaves its current sign, and the orb to
+    the closest aspect target shrinks over the next time increment.
+    """
+    if abs(speed1) > abs(speed2):
+        fast_lon, fast_speed, slow_lon, slow_speed = lon1, speed1, lon2, speed2
+    else:
+        fast_lon, fast_speed, slow_lon, slow_speed = lon2, speed2, lon1, speed1
+    
+    # Current separation normalized to -180..+180
+    separation = wrap180(fast_lon - slow_lon)
+    
+    # Closest aspect target, checking both directions (unrolled, no candidate list)
+    target = aspect_degrees
+    closest_target = target
+    current_orb = abs(separation - target)
+    orb = abs(separation + target)
+    if orb < current_orb:
+        closest_target, current_orb = -target, orb
+    if target != 0.0 and target != 180.0:
+        orb = abs(separation - target + 360.0)
+        if orb < current_orb:
+            closest_target, current_orb = target - 360.0, orb
+        orb = abs(separation + target - 360.0)
+        if orb < current_orb:
+            closest_target, current_orb = 360.0 - target, orb
+    
+    # Aspect must perfect before either planet exits its sign
+    relative_speed = abs(fast_speed - slow_speed)
+    days_to_perfect = current_orb / relative_speed if relative_speed > 0 else math.inf
+    if abs(fast_speed) >= 0.001 and days_to_perfect > _days_to_sign_exit_core(fast_lon, fast_speed):
+        return False
+    if abs(slow_speed) >= 0.001 and days_to_perfect > _days_to_sign_exit_core(slow_lon, slow_speed):
+        return False
+    
+    # Applying if the orb shrinks over the next time increment
+    future_separation = wrap180(separation + (fast_speed - slow_speed) * time_increment)
+    
+    return abs(future_separation - closest_target) < current_orb
+
+
+@njit(cache=True)
+def solar_condition_core(planet_lon: float, sun_lon: float, cazimi_orb: float,
+                         combustion_orb: float, under_beams_orb: float) -> Tuple[float, int, bool]:
+    """
+    Classify a planet's distance from the Sun against the cazimi, combustion
+    and under-the-beams orbs. Returns (elongation, condition code, exact cazimi).
+    """
+    diff = abs(planet_lon - sun_lon)
+    elongation = min(diff, 360 - diff)
+    
+    if elongation <= cazimi_orb:
+        # Within 3 arcminutes = exact cazimi
+        return elongation, SOLAR_CAZIMI, elongation <= (3/60)
+    if elongation <= combustion_orb:
+        return elongation, SOLAR_COMBUSTION, False
+    if elongation <= under_beams_orb:
+        return elongation, SOLAR_UNDER_BEAMS, False
+    return elongation, SOLAR_FREE, False
+
+
+@functools.lru_cache(maxsize=None)
+def warm_up_kernels() -> None:
+    """
+    Compile the JIT kernels once per process, loading them from Numba's on-disk
+    cache when available, so the first chart does not pay the compile cost.
+    
+    A no-op after the first call, and cheap when Numba is not installed.
+    """
+    angular_separation(10.0, 350.0)
+    _days_to_sign_exit_core(10.0, 1.0)
+    is_applying_core(65.0, 13.0, 10.0, 1.2, 60.0, 0.1)
+    house_positions_core(np.zeros(1), np.arange(12) * 30.0)
+    solar_condition_core(10.0, 15.0, 17/60, 8.5, 15.0)
+    localize_offsets_core(np.zeros(1, dtype=np.int64), np.zeros(1, dtype=np.int64),
+                          np.zeros(1, dtype=bool), np.zeros(1, dtype=np.int64))
+
+
 class LocationError(Exception):
     """Custom exception for geocoding failures"""
     pass
 
 
+# Nominatim usage policy for bulk lookups (judge_many): at most one request per second
+NOMINATIM_MIN_DELAY_SECONDS = 1.0
+
+
+@functools.lru_cache(maxsize=1)
+def get_geolocator():
+    """Shared Nominatim client; reusing it keeps one HTTP session and its pooled connections"""
+    from geopy.geocoders import Nominatim
+    return Nominatim(user_agent="horary_astrology_precise")
+
+
 def safe_geocode(location_string: str, timeout: int = 10) -> Tuple[float, float, str]:
     """
     Geocode location with fail-fast behavior (no silent defaults).
@@ -349,12 +624,9 @@ def safe_geocode(location_string: str, timeout: int = 10) -> Tuple[float, float,
     Classical source: Traditional requirement for accurate locality in horary
     """
     try:
-        from geopy.geocoders import Nominatim
         from geopy.exc import GeocoderTimedOut, GeocoderUnavailable
         
-        geolocator = Nominatim(user_agent="horary_astrology_precise")
-        
-        location = geolocator.geocode(location_string, timeout=timeout)
+        location = get_geolocator().geocode(location_string, timeout=timeout)
         
         if location is None:
             raise LocationError(f"Location not found: '{location_string}'. Please provide a more specific location.")
@@ -385,4 +657,10 @@ def degrees_to_dms(degrees: float) -> Tuple[int, int, float]:
     if degrees < 0:
         deg = -deg
     
-    return (deg, min_int, sec)
\ No newline at end of file
+    return (deg, min_int, sec)
+
+
+def format_timing_description(days: float) -> str:
+    """Describe how soon something perfects, e.g. "Within 3 weeks" """
+    template, unit = _TIMING_FORMATS[bisect.bisect_right(_TIMING_EDGES, days)]
+    return template if unit is None else template.format(int(days / unit))
\ No newline at end of file
@@ -38,6 +38,20 @@ from functools import wraps
 
 from collections import defaultdict
 
+from flask.json.provider import DefaultJSONProvider
+
+
+
+try:
+
+    import orjson
+
+except ImportError:
+
+    # orjson is optional - responses fall back to Flask's stdlib json encoder
+
+    orjson = None
+
 
 
 # UPDATED IMPORT: Use the new enhanced engine
@@ -78,6 +92,46 @@ CORS(app)  # Enable CORS for all routes
 
 
 
+if orjson is not None:
+
+    class OrjsonProvider(DefaultJSONProvider):
+
+        """jsonify() through orjson, keeping the default provider's sorted keys and HTTP dates"""
+
+        option = (orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS |
+
+                  orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATETIME)
+
+    
+
+        def dumps(self, obj, **kwargs):
+
+            if kwargs:  # Custom formatting (e.g. indent) stays with the stdlib encoder
+
+                return super().dumps(obj, **kwargs)
+
+            return orjson.dumps(obj, default=self.default, option=self.option).decode()
+
+    
+
+        def response(self, *args, **kwargs):
+
+            if self.compact is False or (self.compact is None and self._app.debug):
+
+                return super().response(*args, **kwargs)  # Pretty-printed debug output
+
+            obj = self._prepare_response_obj(args, kwargs)
+
+            return self._app.response_class(
+
+                orjson.dumps(obj, default=self.default, option=self.option), mimetype=self.mimetype)
+
+    
+
+    app.json = OrjsonProvider(app)
+
+
+
 # UPDATED: Initialize the enhanced horary engine
 
 horary_engine = HoraryEngine()
@@ -258,9 +312,9 @@ def health_check():
 
     try:
 
-        from timezonefinder import TimezoneFinder
+        from judgment_engine import get_timezone_finder
 
-        tf = TimezoneFinder()
+        tf = get_timezone_finder()
 
         test_tz = tf.timezone_at(lat=51.5074, lng=-0.1278)  # London
 
@@ -4,32 +4,95 @@
 import datetime
 import math
 import logging
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Sequence, Union
 
+import numpy as np
 import swisseph as swe
 
 from horary_config import cfg
 from _horary_math import (
     calculate_next_station_time, calculate_future_longitude,
-    calculate_sign_boundary_longitude, days_to_sign_exit,
+    calculate_sign_boundary_longitude,
     calculate_elongation, is_planet_oriental, sun_altitude_at_civil_twilight,
     calculate_moon_variable_speed, check_aspect_separation_order,
+    is_applying_core, calc_ut_cached, angular_separation, warm_up_kernels,
+    house_positions_core, house_position, solar_condition_core, SOLAR_COMBUSTION, format_timing_description,
     LocationError, safe_geocode, normalize_longitude, degrees_to_dms
 )
 from models import (
     Planet, Aspect, Sign, SolarCondition, SolarAnalysis,
-    PlanetPosition, AspectInfo, LunarAspect, Significator, HoraryChart
+    PlanetPosition, PlanetArrays, AspectInfo, LunarAspect, Significator, HoraryChart
 )
 
 logger = logging.getLogger(__name__)
 
+# Set the Swiss Ephemeris path once per process; calling it again closes and
+# reopens the ephemeris files (and drops Swiss Ephemeris' internal caches)
+swe.set_ephe_path('')
+
+# Enum members cached once; iterating an Enum is slow compared with a tuple
+_ASPECTS = tuple(Aspect)
+_SIGNS = tuple(Sign)
+
+# Aspect angles in enum order (orbs stay config-driven and are read per call).
+# The enum is declared in ascending angle order, so this is also sorted.
+_ASPECT_DEG = np.array([aspect.degrees for aspect in _ASPECTS], dtype=float)
+
+
+def _nearest_aspect(separation: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Index of the nearest aspect angle to each separation (0-180) and the orb to it
+    
+    Only the aspects either side of a separation can be the closest one.
+    """
+    upper = np.clip(np.searchsorted(_ASPECT_DEG, separation), 1, len(_ASPECT_DEG) - 1)
+    lower = upper - 1
+    nearest = np.where(_ASPECT_DEG[upper] - separation < separation - _ASPECT_DEG[lower], upper, lower)
+    return nearest, np.abs(separation - _ASPECT_DEG[nearest])
+
+
+# Julian Day of the J2000.0 epoch and the matching UTC datetime
+_J2000_JD = 2451545.0
+_J2000_DATETIME = datetime.datetime(2000, 1, 1, 12)
+
+
+def _jd_to_datetime(jd: float) -> datetime.datetime:
+    """Convert a Julian Day to a naive UTC datetime, to the nearest second"""
+    return _J2000_DATETIME + datetime.timedelta(seconds=round((jd - _J2000_JD) * 86400.0))
+
+
 class EnhancedTraditionalAstrologicalCalculator:
     """Enhanced Traditional astrological calculations with configuration system"""
     
+    # Signs indexed by 30° segment of longitude (0 = Aries ... 11 = Pisces)
+    _SIGN_BY_INDEX = _SIGNS
+    
+    # Solar conditions indexed by solar_condition_core's condition code
+    _SOLAR_BY_CODE = (SolarCondition.FREE, SolarCondition.CAZIMI,
+                      SolarCondition.COMBUSTION, SolarCondition.UNDER_BEAMS)
+    
+    # Detriment - opposite to rulership
+    DETRIMENT_SIGNS = {
+        Planet.SUN: (Sign.AQUARIUS,),
+        Planet.MOON: (Sign.CAPRICORN,),
+        Planet.MERCURY: (Sign.PISCES, Sign.SAGITTARIUS),
+        Planet.VENUS: (Sign.ARIES, Sign.SCORPIO),
+        Planet.MARS: (Sign.LIBRA, Sign.TAURUS),
+        Planet.JUPITER: (Sign.GEMINI, Sign.VIRGO),
+        Planet.SATURN: (Sign.CANCER, Sign.LEO)
+    }
+    
+    # Traditional house joys
+    HOUSE_JOYS = {
+        Planet.MERCURY: 1,  # 1st house
+        Planet.MOON: 3,     # 3rd house
+        Planet.VENUS: 5,    # 5th house
+        Planet.MARS: 6,     # 6th house
+        Planet.SUN: 9,      # 9th house
+        Planet.JUPITER: 11, # 11th house
+        Planet.SATURN: 12   # 12th house
+    }
+    
     def __init__(self):
-        # Set Swiss Ephemeris path
-        swe.set_ephe_path('')
-        
         # Traditional planets only
         self.planets_swe = {
             Planet.SUN: swe.SUN,
@@ -51,6 +114,8 @@ class EnhancedTraditionalAstrologicalCalculator:
             Planet.JUPITER: Sign.CANCER,
             Planet.SATURN: Sign.LIBRA
         }
+        # (planet, sign) membership form of the exaltations, for reception checks
+        self.exaltation_pairs = frozenset(self.exaltations.items())
         
         # Traditional falls (opposite to exaltations)
         self.falls = {
@@ -68,12 +133,22 @@ class EnhancedTraditionalAstrologicalCalculator:
             Planet.MERCURY: "Mercury rejoices near Sun",
             Planet.VENUS: "Venus as morning/evening star"
         }
+        
+        # Dignity score tables, rebuilt whenever the configuration is reloaded
+        self._planet_index = {planet: i for i, planet in enumerate(self.planets_swe)}
+        self._dignity_config = None
+        self._dignity_table = None
+        self._house_joys = None
+        self._angularity = None
+        self._dignity_cube = None
+        
+        # Compile (or load from cache) the numeric kernels before the first chart
+        warm_up_kernels()
     
     def get_real_moon_speed(self, jd_ut: float) -> float:
         """Get actual Moon speed from ephemeris in degrees per day"""
         try:
-            moon_data, ret_flag = swe.calc_ut(jd_ut, swe.MOON, swe.FLG_SWIEPH | swe.FLG_SPEED)
-            return abs(moon_data[3])  # degrees per day
+            return abs(calc_ut_cached(jd_ut, swe.MOON)[3])  # degrees per day
         except Exception as e:
             logger.warning(f"Failed to get Moon speed from ephemeris: {e}")
             # Fall back to configured default
@@ -93,42 +168,18 @@ class EnhancedTraditionalAstrologicalCalculator:
         logger.info(f"  Julian Day (UT): {jd_ut}")
         logger.info(f"  Location: {location_name} ({lat:.4f}, {lon:.4f})")
         
-        # Calculate traditional planets only
-        planets = {}
-        for planet_enum, planet_id in self.planets_swe.items():
-            try:
-                planet_data, ret_flag = swe.calc_ut(jd_ut, planet_id, swe.FLG_SWIEPH | swe.FLG_SPEED)
-                
-                longitude = planet_data[0]
-                latitude = planet_data[1]
-                speed = planet_data[3]  # degrees/day
-                retrograde = speed < 0
-                
-                sign = self._get_sign(longitude)
-                
-                planets[planet_enum] = PlanetPosition(
-                    planet=planet_enum,
-                    longitude=longitude,
-                    latitude=latitude,
-                    house=0,  # Will be calculated after houses
-                    sign=sign,
-                    dignity_score=0,  # Will be calculated after solar analysis
-                    retrograde=retrograde,
-                    speed=speed
-                )
-                
-            except Exception as e:
-                logger.error(f"Error calculating {planet_enum.value}: {e}")
-                # Create fallback
-                planets[planet_enum] = PlanetPosition(
-                    planet=planet_enum,
-                    longitude=0.0,
-                    latitude=0.0,
-                    house=1,
-                    sign=Sign.ARIES,
-                    dignity_score=0,
-                    speed=0.0
-                )
+        # Snapshot configuration once for the whole chart
+        config = cfg()
+        cazimi_orb = config.orbs.cazimi_orb_arcmin / 60.0  # Convert arcminutes to degrees
+        combustion_orb = config.orbs.combustion_orb
+        under_beams_orb = config.orbs.under_beams_orb
+        sun_orb_bonus = config.orbs.sun_orb_bonus
+        moon_orb_bonus = config.orbs.moon_orb_bonus
+        precision_days = config.timing.timing_precision_days
+        max_future_days = config.timing.max_future_days
+        
+        # Calculate traditional planets only; a failed planet falls back to 0° Aries
+        planet_rows = np.nan_to_num(self._calculate_planet_rows(jd_ut), nan=0.0)
         
         # Calculate houses (Regiomontanus - traditional for horary)
         try:
@@ -142,36 +193,50 @@ class EnhancedTraditionalAstrologicalCalculator:
             midheaven = 90.0
             houses = [i * 30.0 for i in range(12)]
         
-        # Calculate house positions and house rulers
-        house_rulers = {}
-        for i, cusp in enumerate(houses, 1):
-            sign = self._get_sign(cusp)
-            house_rulers[i] = sign.ruler
-        
-        # Update planet house positions
-        for planet_pos in planets.values():
-            house = self._calculate_house_position(planet_pos.longitude, houses)
-            planet_pos.house = house
+        # Cusps normalized once per chart, shared by the ruler and house lookups
+        cusps = np.asarray(houses, dtype=np.float64) % 360.0
+        
+        # House rulers from the sign on each cusp
+        cusp_signs = np.minimum(cusps // 30, 11).astype(np.intp).tolist()
+        house_rulers = {i: _SIGNS[sign_idx].ruler for i, sign_idx in enumerate(cusp_signs, 1)}
+        
+        # Fill the planet arrays straight from the ephemeris rows
+        longitudes = planet_rows[:, 0]
+        planet_arrays = PlanetArrays(
+            planets=tuple(self.planets_swe),
+            lon=longitudes,
+            lat=planet_rows[:, 1],
+            speed=planet_rows[:, 3],  # degrees/day
+            sign_idx=np.minimum(longitudes % 360 // 30, 11).astype(np.int8),
+            house_idx=self._calculate_house_position(longitudes, cusps).astype(np.int8),
+            dignity=np.zeros(len(longitudes), dtype=np.int16)  # Filled after solar analysis
+        )
+        planets = {planet_enum: PlanetPosition.from_row(planet_enum, row, sign_idx, house)
+                   for planet_enum, row, sign_idx, house in zip(
+                       planet_arrays.planets, planet_rows,
+                       planet_arrays.sign_idx.tolist(), planet_arrays.house_idx.tolist())}
         
         # Enhanced solar condition analysis
         sun_pos = planets[Planet.SUN]
         solar_analyses = {}
         
-        for planet_enum, planet_pos in planets.items():
+        for i, (planet_enum, planet_pos) in enumerate(planets.items()):
             solar_analysis = self._analyze_enhanced_solar_condition(
-                planet_enum, planet_pos, sun_pos, lat, lon, jd_ut)
+                planet_enum, planet_pos, sun_pos, lat, lon, jd_ut,
+                cazimi_orb, combustion_orb, under_beams_orb)
             solar_analyses[planet_enum] = solar_analysis
             
             # Calculate dignity with enhanced solar conditions
             planet_pos.dignity_score = self._calculate_enhanced_dignity(
-                planet_pos.planet, planet_pos.sign, planet_pos.house, solar_analysis)
+                planet_pos.planet, planet_pos.sign, planet_pos.house, solar_analysis, config)
+            planet_arrays.dignity[i] = planet_pos.dignity_score
         
         # Calculate enhanced traditional aspects
-        aspects = self._calculate_enhanced_aspects(planets, jd_ut)
+        aspects = self._calculate_enhanced_aspects(planets, jd_ut, sun_orb_bonus, moon_orb_bonus,
+                                                   precision_days, max_future_days, planet_arrays)
         
         # NEW: Calculate last and next lunar aspects
-        moon_last_aspect = self._calculate_moon_last_aspect(planets, jd_ut)
-        moon_next_aspect = self._calculate_moon_next_aspect(planets, jd_ut)
+        moon_last_aspect, moon_next_aspect = self._moon_aspects(planets, jd_ut, planet_arrays)
         
         chart = HoraryChart(
             date_time=dt_local,
@@ -188,172 +253,126 @@ class EnhancedTraditionalAstrologicalCalculator:
             solar_analyses=solar_analyses,
             julian_day=jd_ut,
             moon_last_aspect=moon_last_aspect,
-            moon_next_aspect=moon_next_aspect
+            moon_next_aspect=moon_next_aspect,
+            planet_arrays=planet_arrays,
+            houses_arr=cusps
         )
         
         return chart
     
-    def _calculate_moon_last_aspect(self, planets: Dict[Planet, PlanetPosition], 
-                                   jd_ut: float) -> Optional[LunarAspect]:
-        """Calculate Moon's last separating aspect"""
+    def _calculate_planet_rows(self, jd_ut: float) -> np.ndarray:
+        """Gather Swiss Ephemeris data for all traditional planets into a (7, 6) array
         
-        moon_pos = planets[Planet.MOON]
-        moon_speed = self.get_real_moon_speed(jd_ut)
-        
-        # Look back to find most recent separating aspect
-        separating_aspects = []
-        
-        for planet, planet_pos in planets.items():
-            if planet == Planet.MOON:
-                continue
-            
-            # Calculate current separation
-            separation = abs(moon_pos.longitude - planet_pos.longitude)
-            if separation > 180:
-                separation = 360 - separation
-            
-            # Check each aspect type
-            for aspect_type in Aspect:
-                orb_diff = abs(separation - aspect_type.degrees)
-                max_orb = aspect_type.orb
-                
-                # Wider orb for recently separating
-                if orb_diff <= max_orb * 1.5:
-                    # Check if separating (Moon was closer recently)
-                    if self._is_moon_separating_from_aspect(moon_pos, planet_pos, aspect_type, moon_speed):
-                        degrees_since_exact = orb_diff
-                        time_since_exact = degrees_since_exact / moon_speed
-                        
-                        separating_aspects.append(LunarAspect(
-                            planet=planet,
-                            aspect=aspect_type,
-                            orb=orb_diff,
-                            degrees_difference=degrees_since_exact,
-                            perfection_eta_days=time_since_exact,
-                            perfection_eta_description=f"{time_since_exact:.1f} days ago",
-                            applying=False
-                        ))
-        
-        # Return most recent (smallest time_since_exact)
-        if separating_aspects:
-            return min(separating_aspects, key=lambda x: x.perfection_eta_days)
-        
-        return None
+        Rows follow self.planets_swe order; a planet that fails is left as NaN.
+        """
+        try:
+            return np.array([calc_ut_cached(jd_ut, planet_id) for planet_id in self.planets_swe.values()],
+                            dtype=float)
+        except Exception:
+            pass
+        
+        # Cold path: retry planet by planet so one failure does not lose the rest
+        rows = np.full((len(self.planets_swe), 6), np.nan)
+        for i, (planet_enum, planet_id) in enumerate(self.planets_swe.items()):
+            try:
+                rows[i] = calc_ut_cached(jd_ut, planet_id)
+            except Exception as e:
+                logger.debug(f"Error calculating {planet_enum.value}: {e}")
+        return rows
     
-    def _calculate_moon_next_aspect(self, planets: Dict[Planet, PlanetPosition], 
-                                   jd_ut: float) -> Optional[LunarAspect]:
-        """Calculate Moon's next applying aspect"""
+    def _moon_aspects(self, planets: Dict[Planet, PlanetPosition], jd_ut: float,
+                      planet_arrays: Optional[PlanetArrays] = None
+                      ) -> Tuple[Optional[LunarAspect], Optional[LunarAspect]]:
+        """Calculate Moon's last separating and next applying aspects in one pass"""
         
+        if planet_arrays is None:
+            planet_arrays = PlanetArrays.from_positions(planets)
         moon_pos = planets[Planet.MOON]
+        is_other = np.array([planet != Planet.MOON for planet in planet_arrays.planets])
+        others = [planet for planet in planet_arrays.planets if planet != Planet.MOON]
+        if not others:
+            return None, None
+        
         moon_speed = self.get_real_moon_speed(jd_ut)
+        aspect_types = _ASPECTS
+        aspect_orbs = np.array([aspect_type.orb for aspect_type in aspect_types], dtype=float)
+        
+        # Stage 1: separation to every other planet and the orb to its nearest aspect;
+        # aspect orbs never overlap, so no other aspect can be active for that planet
+        lons = planet_arrays.lon[is_other]
+        speeds = planet_arrays.speed[is_other]
+        moon_index = planet_arrays.planets.index(Planet.MOON)
+        separation = planet_arrays.pairwise_separation()[moon_index, is_other]
+        nearest, orb = _nearest_aspect(separation)
+        nearest_orbs = aspect_orbs[nearest]
+        
+        # Stage 2: the orb shrinks when the separation moves towards the aspect angle.
+        # The separation grows while the Moon is less than 180° ahead of the planet.
+        separation_trend = np.where((moon_pos.longitude - lons) % 360 < 180, 1.0, -1.0)
+        orb_rate = separation_trend * (moon_speed - speeds) * np.sign(separation - _ASPECT_DEG[nearest])
+        
+        # Stage 3: soonest candidate across all planets
+        moon_last_aspect = None
+        # Wider orb for recently separating
+        last_mask = (orb_rate > 0) & (orb <= nearest_orbs * 1.5)
+        if last_mask.any():
+            eta_last = np.where(last_mask, orb / moon_speed, np.inf)
+            pi = self._soonest_candidate(eta_last, last_mask)
+            time_since_exact = float(eta_last[pi])
+            moon_last_aspect = LunarAspect(
+                planet=others[pi],
+                aspect=aspect_types[nearest[pi]],
+                orb=float(orb[pi]),
+                degrees_difference=float(orb[pi]),
+                perfection_eta_days=time_since_exact,
+                perfection_eta_description=f"{time_since_exact:.1f} days ago",
+                applying=False
+            )
         
-        # Find closest applying aspect
-        applying_aspects = []
+        moon_next_aspect = None
+        next_mask = (orb_rate < 0) & (orb <= nearest_orbs)
+        if next_mask.any():
+            relative_speed = np.abs(moon_speed - np.abs(speeds))
+            with np.errstate(divide='ignore'):
+                eta_next = np.where(next_mask & (relative_speed > 0), orb / relative_speed, np.inf)
+            pi = self._soonest_candidate(eta_next, next_mask)
+            time_to_exact = float(eta_next[pi])
+            moon_next_aspect = LunarAspect(
+                planet=others[pi],
+                aspect=aspect_types[nearest[pi]],
+                orb=float(orb[pi]),
+                degrees_difference=float(orb[pi]),
+                perfection_eta_days=time_to_exact,
+                perfection_eta_description=self._format_timing_description(time_to_exact),
+                applying=True
+            )
         
-        for planet, planet_pos in planets.items():
-            if planet == Planet.MOON:
-                continue
-            
-            # Calculate current separation
-            separation = abs(moon_pos.longitude - planet_pos.longitude)
-            if separation > 180:
-                separation = 360 - separation
-            
-            # Check each aspect type
-            for aspect_type in Aspect:
-                orb_diff = abs(separation - aspect_type.degrees)
-                max_orb = aspect_type.orb
-                
-                if orb_diff <= max_orb:
-                    # Check if applying
-                    if self._is_moon_applying_to_aspect(moon_pos, planet_pos, aspect_type, moon_speed):
-                        degrees_to_exact = orb_diff
-                        relative_speed = abs(moon_speed - abs(planet_pos.speed))
-                        time_to_exact = degrees_to_exact / relative_speed if relative_speed > 0 else float('inf')
-                        
-                        applying_aspects.append(LunarAspect(
-                            planet=planet,
-                            aspect=aspect_type,
-                            orb=orb_diff,
-                            degrees_difference=degrees_to_exact,
-                            perfection_eta_days=time_to_exact,
-                            perfection_eta_description=self._format_timing_description(time_to_exact),
-                            applying=True
-                        ))
-        
-        # Return soonest (smallest time_to_exact)
-        if applying_aspects:
-            return min(applying_aspects, key=lambda x: x.perfection_eta_days)
-        
-        return None
-    
-    def _is_moon_separating_from_aspect(self, moon_pos: PlanetPosition, 
-                                       planet_pos: PlanetPosition, aspect: Aspect, 
-                                       moon_speed: float) -> bool:
-        """Check if Moon is separating from an aspect"""
-        
-        # Calculate separation change over time
-        time_increment = 0.1  # days
-        current_separation = abs(moon_pos.longitude - planet_pos.longitude)
-        if current_separation > 180:
-            current_separation = 360 - current_separation
-        
-        # Future Moon position
-        future_moon_lon = (moon_pos.longitude + moon_speed * time_increment) % 360
-        future_separation = abs(future_moon_lon - planet_pos.longitude)
-        if future_separation > 180:
-            future_separation = 360 - future_separation
-        
-        # Separating if orb from aspect degree is increasing
-        current_orb = abs(current_separation - aspect.degrees)
-        future_orb = abs(future_separation - aspect.degrees)
-        
-        return future_orb > current_orb
+        return moon_last_aspect, moon_next_aspect
     
-    def _is_moon_applying_to_aspect(self, moon_pos: PlanetPosition, 
-                                   planet_pos: PlanetPosition, aspect: Aspect, 
-                                   moon_speed: float) -> bool:
-        """Check if Moon is applying to an aspect"""
-        
-        # Calculate separation change over time
-        time_increment = 0.1  # days
-        current_separation = abs(moon_pos.longitude - planet_pos.longitude)
-        if current_separation > 180:
-            current_separation = 360 - current_separation
-        
-        # Future Moon position
-        future_moon_lon = (moon_pos.longitude + moon_speed * time_increment) % 360
-        future_separation = abs(future_moon_lon - planet_pos.longitude)
-        if future_separation > 180:
-            future_separation = 360 - future_separation
-        
-        # Applying if orb from aspect degree is decreasing
-        current_orb = abs(current_separation - aspect.degrees)
-        future_orb = abs(future_separation - aspect.degrees)
-        
-        return future_orb < current_orb
+    @staticmethod
+    def _soonest_candidate(eta: np.ndarray, mask: np.ndarray) -> int:
+        """Index of the soonest masked candidate, first one on ties
+        
+        `eta` is inf outside the mask, so a plain argmin finds the winner; only when
+        every candidate is inf (no relative motion) does it fall back to the mask.
+        """
+        best = int(np.argmin(eta))
+        if not np.isfinite(eta[best]):
+            best = int(np.argmax(mask))
+        return best
     
     def _format_timing_description(self, days: float) -> str:
         """Format timing description for aspect perfection"""
-        if days < 0.5:
-            return "Within hours"
-        elif days < 1:
-            return "Within a day"
-        elif days < 7:
-            return f"Within {int(days)} days"
-        elif days < 30:
-            return f"Within {int(days/7)} weeks"
-        elif days < 365:
-            return f"Within {int(days/30)} months"
-        else:
-            return "More than a year"
+        return format_timing_description(days)
     
     # [Continue with the rest of the methods...]
     # Due to space constraints, I'll continue with key methods
     
     def _analyze_enhanced_solar_condition(self, planet: Planet, planet_pos: PlanetPosition, 
                                         sun_pos: PlanetPosition, lat: float, lon: float,
-                                        jd_ut: float) -> SolarAnalysis:
+                                        jd_ut: float, cazimi_orb: Optional[float] = None,
+                                        combustion_orb: Optional[float] = None,
+                                        under_beams_orb: Optional[float] = None) -> SolarAnalysis:
         """Enhanced solar condition analysis with configuration"""
         
         # Don't analyze the Sun itself
@@ -365,72 +384,34 @@ class EnhancedTraditionalAstrologicalCalculator:
                 exact_cazimi=False
             )
         
-        # Calculate elongation
-        elongation = calculate_elongation(planet_pos.longitude, sun_pos.longitude)
-        
-        # Get configured orbs
-        cazimi_orb = cfg().orbs.cazimi_orb_arcmin / 60.0  # Convert arcminutes to degrees
-        combustion_orb = cfg().orbs.combustion_orb
-        under_beams_orb = cfg().orbs.under_beams_orb
-        
-        # Enhanced visibility check for Venus and Mercury
-        traditional_exception = False
-        if planet in self.combustion_resistant:
-            traditional_exception = self._check_enhanced_combustion_exception(
-                planet, planet_pos, sun_pos, lat, lon, jd_ut)
+        # Get configured orbs unless the caller already snapshotted them
+        if cazimi_orb is None:
+            cazimi_orb = cfg().orbs.cazimi_orb_arcmin / 60.0  # Convert arcminutes to degrees
+        if combustion_orb is None:
+            combustion_orb = cfg().orbs.combustion_orb
+        if under_beams_orb is None:
+            under_beams_orb = cfg().orbs.under_beams_orb
         
         # Determine condition by hierarchy
-        if elongation <= cazimi_orb:
-            # Cazimi - Heart of the Sun (maximum dignity)
-            exact_cazimi = elongation <= (3/60)  # Within 3 arcminutes = exact cazimi
+        elongation, code, exact_cazimi = solar_condition_core(
+            planet_pos.longitude, sun_pos.longitude, cazimi_orb, combustion_orb, under_beams_orb)
+        
+        # Enhanced visibility check for Venus and Mercury: an exception negates
+        # combustion and reduces the beams to free (cazimi overrides exceptions)
+        if (code >= SOLAR_COMBUSTION and planet in self.combustion_resistant and
+                self._check_enhanced_combustion_exception(planet, planet_pos, sun_pos, lat, lon, jd_ut)):
             return SolarAnalysis(
                 planet=planet,
                 distance_from_sun=elongation,
-                condition=SolarCondition.CAZIMI,
-                exact_cazimi=exact_cazimi,
-                traditional_exception=False  # Cazimi overrides exceptions
+                condition=SolarCondition.FREE,
+                traditional_exception=True
             )
         
-        elif elongation <= combustion_orb:
-            # Combustion - but check for traditional exceptions
-            if traditional_exception:
-                return SolarAnalysis(
-                    planet=planet,
-                    distance_from_sun=elongation,
-                    condition=SolarCondition.FREE,  # Exception negates combustion
-                    traditional_exception=True
-                )
-            else:
-                return SolarAnalysis(
-                    planet=planet,
-                    distance_from_sun=elongation,
-                    condition=SolarCondition.COMBUSTION,
-                    traditional_exception=False
-                )
-        
-        elif elongation <= under_beams_orb:
-            # Under the Beams - with exception handling
-            if traditional_exception:
-                return SolarAnalysis(
-                    planet=planet,
-                    distance_from_sun=elongation,
-                    condition=SolarCondition.FREE,  # Exception reduces to free
-                    traditional_exception=True
-                )
-            else:
-                return SolarAnalysis(
-                    planet=planet,
-                    distance_from_sun=elongation,
-                    condition=SolarCondition.UNDER_BEAMS,
-                    traditional_exception=False
-                )
-        
-        # Free of solar interference
         return SolarAnalysis(
             planet=planet,
             distance_from_sun=elongation,
-            condition=SolarCondition.FREE,
-            traditional_exception=False
+            condition=self._SOLAR_BY_CODE[code],
+            exact_cazimi=exact_cazimi
         )
     
     def _check_enhanced_combustion_exception(self, planet: Planet, planet_pos: PlanetPosition,
@@ -471,59 +452,63 @@ class EnhancedTraditionalAstrologicalCalculator:
         
         return False
     
+    def _refresh_dignity_tables(self, config) -> None:
+        """Build the (planet, sign) essential dignity table and house score arrays"""
+        dignity = config.dignity
+        
+        table = np.zeros((len(self.planets_swe), 12), dtype=np.int8)
+        for p_idx, planet in enumerate(self.planets_swe):
+            for s_idx, sign in enumerate(self._SIGN_BY_INDEX):
+                score = 0
+                if sign.ruler == planet:
+                    score += dignity.rulership
+                if self.exaltations.get(planet) == sign:
+                    score += dignity.exaltation
+                if sign in self.DETRIMENT_SIGNS.get(planet, ()):
+                    score += dignity.detriment
+                if self.falls.get(planet) == sign:
+                    score += dignity.fall
+                table[p_idx, s_idx] = score
+        
+        self._dignity_table = table
+        self._house_joys = np.array([self.HOUSE_JOYS.get(planet, -1) for planet in self.planets_swe],
+                                    dtype=np.int8)
+        # Angular (1, 4, 7, 10), succedent (2, 5, 8, 11) and cadent (3, 6, 9, 12) houses
+        self._angularity = np.array([dignity.angular, dignity.succedent, dignity.cadent] * 4,
+                                    dtype=np.int8)
+        
+        # Every (planet, sign, house) combination: essential dignity + joy + angularity
+        joys = np.zeros((len(self.planets_swe), 12), dtype=np.int16)
+        for p_idx, joy_house in enumerate(self._house_joys):
+            if 1 <= joy_house <= 12:
+                joys[p_idx, joy_house - 1] = dignity.joy
+        self._dignity_cube = (table.astype(np.int16)[:, :, None] + joys[:, None, :] +
+                              self._angularity.astype(np.int16)[None, None, :])
+        self._dignity_config = config
+    
     def _calculate_enhanced_dignity(self, planet: Planet, sign: Sign, house: int, 
-                                  solar_analysis: Optional[SolarAnalysis] = None) -> int:
+                                  solar_analysis: Optional[SolarAnalysis] = None,
+                                  config=None) -> int:
         """Enhanced dignity calculation with configuration"""
-        score = 0
-        config = cfg()
-        
-        # Rulership
-        if sign.ruler == planet:
-            score += config.dignity.rulership
-        
-        # Exaltation
-        if planet in self.exaltations and self.exaltations[planet] == sign:
-            score += config.dignity.exaltation
-        
-        # Detriment - opposite to rulership
-        detriment_signs = {
-            Planet.SUN: [Sign.AQUARIUS],
-            Planet.MOON: [Sign.CAPRICORN],
-            Planet.MERCURY: [Sign.PISCES, Sign.SAGITTARIUS],
-            Planet.VENUS: [Sign.ARIES, Sign.SCORPIO],
-            Planet.MARS: [Sign.LIBRA, Sign.TAURUS],
-            Planet.JUPITER: [Sign.GEMINI, Sign.VIRGO],
-            Planet.SATURN: [Sign.CANCER, Sign.LEO]
-        }
-        
-        if planet in detriment_signs and sign in detriment_signs[planet]:
-            score += config.dignity.detriment
-        
-        # Fall
-        if planet in self.falls and self.falls[planet] == sign:
-            score += config.dignity.fall
-        
-        # House considerations - traditional joys
-        house_joys = {
-            Planet.MERCURY: 1,  # 1st house
-            Planet.MOON: 3,     # 3rd house
-            Planet.VENUS: 5,    # 5th house
-            Planet.MARS: 6,     # 6th house
-            Planet.SUN: 9,      # 9th house
-            Planet.JUPITER: 11, # 11th house
-            Planet.SATURN: 12   # 12th house
-        }
-        
-        if planet in house_joys and house_joys[planet] == house:
-            score += config.dignity.joy
-        
-        # Angular houses
-        if house in [1, 4, 7, 10]:
-            score += config.dignity.angular
-        elif house in [2, 5, 8, 11]:  # Succedent houses
-            score += config.dignity.succedent
-        elif house in [3, 6, 9, 12]:  # Cadent houses
-            score += config.dignity.cadent
+        if config is None:
+            config = cfg()
+        if self._dignity_config is not config:
+            self._refresh_dignity_tables(config)
+        
+        p_idx = self._planet_index.get(planet)
+        if p_idx is not None and 1 <= house <= 12:
+            # Rulership, exaltation, detriment, fall, joy and angularity in one lookup
+            score = int(self._dignity_cube[p_idx, sign.start_degree // 30, house - 1])
+        else:
+            score = 0
+            
+            # Rulership, exaltation, detriment and fall
+            if p_idx is not None:
+                score += int(self._dignity_table[p_idx, sign.start_degree // 30])
+            
+            # Angular, succedent or cadent house
+            if 1 <= house <= 12:
+                score += int(self._angularity[house - 1])
         
         # Enhanced solar conditions
         if solar_analysis:
@@ -547,122 +532,89 @@ class EnhancedTraditionalAstrologicalCalculator:
         return score
     
     def _calculate_enhanced_aspects(self, planets: Dict[Planet, PlanetPosition], 
-                                  jd_ut: float) -> List[AspectInfo]:
+                                  jd_ut: float, sun_orb_bonus: Optional[float] = None,
+                                  moon_orb_bonus: Optional[float] = None,
+                                  precision_days: Optional[float] = None,
+                                  max_future_days: Optional[float] = None,
+                                  planet_arrays: Optional[PlanetArrays] = None) -> List[AspectInfo]:
         """Enhanced aspect calculation with configuration"""
         aspects = []
-        planet_list = list(planets.keys())
+        if planet_arrays is None:
+            planet_arrays = PlanetArrays.from_positions(planets)
+        planet_list = planet_arrays.planets
+        n = len(planet_list)
+        if n < 2:
+            return aspects
+        
+        # Resolve configured values once rather than per pair
         config = cfg()
-        
-        for i, planet1 in enumerate(planet_list):
-            for planet2 in planet_list[i+1:]:
-                pos1 = planets[planet1]
-                pos2 = planets[planet2]
-                
-                # Calculate angular separation
-                angle_diff = abs(pos1.longitude - pos2.longitude)
-                if angle_diff > 180:
-                    angle_diff = 360 - angle_diff
-                
-                # Check each traditional aspect
-                for aspect_type in Aspect:
-                    orb_diff = abs(angle_diff - aspect_type.degrees)
-                    
-                    # Configured orbs
-                    max_orb = aspect_type.orb
-                    
-                    # Luminary bonuses
-                    if Planet.SUN in [planet1, planet2]:
-                        max_orb += config.orbs.sun_orb_bonus
-                    if Planet.MOON in [planet1, planet2]:
-                        max_orb += config.orbs.moon_orb_bonus
-                    
-                    if orb_diff <= max_orb:
-                        # Determine if applying
-                        applying = self._is_applying_enhanced(pos1, pos2, aspect_type, jd_ut)
-                        
-                        # Calculate degrees to exact and timing
-                        degrees_to_exact, exact_time = self._calculate_enhanced_degrees_to_exact(
-                            pos1, pos2, aspect_type, jd_ut)
-                        
-                        aspects.append(AspectInfo(
-                            planet1=planet1,
-                            planet2=planet2,
-                            aspect=aspect_type,
-                            orb=orb_diff,
-                            applying=applying,
-                            exact_time=exact_time,
-                            degrees_to_exact=degrees_to_exact
-                        ))
-                        break
+        if sun_orb_bonus is None:
+            sun_orb_bonus = config.orbs.sun_orb_bonus
+        if moon_orb_bonus is None:
+            moon_orb_bonus = config.orbs.moon_orb_bonus
+        if precision_days is None:
+            precision_days = config.timing.timing_precision_days
+        if max_future_days is None:
+            max_future_days = config.timing.max_future_days
+        aspect_types = _ASPECTS
+        aspect_orbs = np.array([aspect_type.orb for aspect_type in aspect_types], dtype=float)
+        
+        # Pairwise angular separations folded into 0-180, shared with the Moon pass
+        sep = planet_arrays.pairwise_separation()
+        
+        # Luminary bonuses for every pair involving the Sun and/or Moon
+        is_sun = np.array([p == Planet.SUN for p in planet_list])
+        is_moon = np.array([p == Planet.MOON for p in planet_list])
+        luminary_bonus = ((is_sun[:, None] | is_sun[None, :]) * sun_orb_bonus +
+                          (is_moon[:, None] | is_moon[None, :]) * moon_orb_bonus)
+        
+        # Nearest aspect angle for each pair in the upper triangle
+        rows, cols = np.triu_indices(n, 1)
+        nearest, orb = _nearest_aspect(sep[rows, cols])
+        in_orb = orb <= aspect_orbs[nearest] + luminary_bonus[rows, cols]
+        
+        for k in np.flatnonzero(in_orb):
+            planet1 = planet_list[rows[k]]
+            planet2 = planet_list[cols[k]]
+            pos1 = planets[planet1]
+            pos2 = planets[planet2]
+            aspect_type = aspect_types[nearest[k]]
+            
+            # Determine if applying
+            applying = self._is_applying_enhanced(pos1, pos2, aspect_type, jd_ut, precision_days)
+            
+            # Calculate degrees to exact and timing
+            degrees_to_exact, exact_time = self._calculate_enhanced_degrees_to_exact(
+                pos1, pos2, aspect_type, jd_ut, max_future_days)
+            
+            aspects.append(AspectInfo(
+                planet1=planet1,
+                planet2=planet2,
+                aspect=aspect_type,
+                orb=float(orb[k]),
+                applying=applying,
+                exact_time=exact_time,
+                degrees_to_exact=degrees_to_exact
+            ))
         
         return aspects
     
     def _is_applying_enhanced(self, pos1: PlanetPosition, pos2: PlanetPosition, 
-                            aspect: Aspect, jd_ut: float) -> bool:
+                            aspect: Aspect, jd_ut: float,
+                            precision_days: Optional[float] = None) -> bool:
         """Enhanced applying check with directional sign-exit check"""
-        
-        # Faster planet applies to slower planet
-        if abs(pos1.speed) > abs(pos2.speed):
-            faster, slower = pos1, pos2
-        else:
-            faster, slower = pos2, pos1
-        
-        # Calculate current separation
-        separation = faster.longitude - slower.longitude
-        
-        # Normalize to -180 to +180
-        while separation > 180:
-            separation -= 360
-        while separation < -180:
-            separation += 360
-        
-        # Calculate target separation for this aspect
-        target = aspect.degrees
-        
-        # Check both directions
-        targets = [target, -target]
-        if target != 0 and target != 180:
-            targets.extend([target - 360, -target + 360])
-        
-        # Find closest target
-        closest_target = min(targets, key=lambda t: abs(separation - t))
-        current_orb = abs(separation - closest_target)
-        
-        # Check if aspect will perfect before either planet exits sign
-        days_to_perfect = current_orb / abs(faster.speed - slower.speed) if abs(faster.speed - slower.speed) > 0 else float('inf')
-        
-        # Check days until each planet exits its current sign (directional)
-        faster_days_to_exit = days_to_sign_exit(faster.longitude, faster.speed)
-        slower_days_to_exit = days_to_sign_exit(slower.longitude, slower.speed)
-        
-        # If either planet exits sign before perfection, aspect does not apply
-        if faster_days_to_exit and days_to_perfect > faster_days_to_exit:
-            return False
-        if slower_days_to_exit and days_to_perfect > slower_days_to_exit:
-            return False
-        
-        # Calculate future position to confirm applying
-        time_increment = cfg().timing.timing_precision_days
-        future_separation = separation + (faster.speed - slower.speed) * time_increment
-        
-        # Normalize future separation
-        while future_separation > 180:
-            future_separation -= 360
-        while future_separation < -180:
-            future_separation += 360
-        
-        future_orb = abs(future_separation - closest_target)
-        
-        return future_orb < current_orb
+        if precision_days is None:
+            precision_days = cfg().timing.timing_precision_days
+        return is_applying_core(pos1.longitude, pos1.speed, pos2.longitude, pos2.speed,
+                                float(aspect.degrees), precision_days)
     
     def _calculate_enhanced_degrees_to_exact(self, pos1: PlanetPosition, pos2: PlanetPosition, 
-                                           aspect: Aspect, jd_ut: float) -> Tuple[float, Optional[datetime.datetime]]:
+                                           aspect: Aspect, jd_ut: float,
+                                           max_future_days: Optional[float] = None) -> Tuple[float, Optional[datetime.datetime]]:
         """Enhanced degrees and time calculation"""
         
         # Current separation
-        separation = abs(pos1.longitude - pos2.longitude)
-        if separation > 180:
-            separation = 360 - separation
+        separation = angular_separation(pos1.longitude, pos2.longitude)
         
         # Orb from exact
         orb_from_exact = abs(separation - aspect.degrees)
@@ -672,15 +624,13 @@ class EnhancedTraditionalAstrologicalCalculator:
         if abs(pos1.speed - pos2.speed) > 0:
             days_to_exact = orb_from_exact / abs(pos1.speed - pos2.speed)
             
-            max_future_days = cfg().timing.max_future_days
+            if max_future_days is None:
+                max_future_days = cfg().timing.max_future_days
             if days_to_exact < max_future_days:
                 try:
-                    exact_jd = jd_ut + days_to_exact
                     # Convert back to datetime
-                    year, month, day, hour = swe.jdut1_to_utc(exact_jd, 1)  # Flag 1 for Gregorian
-                    exact_time = datetime.datetime(int(year), int(month), int(day), 
-                                                 int(hour), int((hour % 1) * 60))
-                except:
+                    exact_time = _jd_to_datetime(jd_ut + days_to_exact)
+                except (OverflowError, ValueError):
                     exact_time = None
         
         # If already very close, return small value
@@ -691,27 +641,20 @@ class EnhancedTraditionalAstrologicalCalculator:
     
     def _get_sign(self, longitude: float) -> Sign:
         """Get zodiac sign from longitude"""
-        longitude = longitude % 360
-        for sign in Sign:
-            if sign.start_degree <= longitude < (sign.start_degree + 30):
-                return sign
-        return Sign.PISCES
+        return self._SIGN_BY_INDEX[min(int(longitude % 360 // 30), 11)]
     
-    def _calculate_house_position(self, longitude: float, houses: List[float]) -> int:
-        """Calculate house position"""
-        longitude = longitude % 360
-        
-        for i in range(12):
-            current_cusp = houses[i] % 360
-            next_cusp = houses[(i + 1) % 12] % 360
-            
-            if current_cusp > next_cusp:  # Crosses 0°
-                if longitude >= current_cusp or longitude < next_cusp:
-                    return i + 1
-            else:
-                if current_cusp <= longitude < next_cusp:
-                    return i + 1
-        
-        return 1
+    def _calculate_house_position(self, longitude: Union[float, np.ndarray],
+                                  houses: Sequence[float]) -> Union[int, np.ndarray]:
+        """Calculate house position for a longitude or an array of longitudes
+        
+        `houses` may be a list of cusps or a chart's `houses_arr`, which is used as is.
+        """
+        if isinstance(longitude, (int, float)):
+            return house_position(longitude, houses)
+        cusps = np.ascontiguousarray(houses, dtype=np.float64)
+        longitudes = np.asarray(longitude, dtype=np.float64)
+        if longitudes.ndim == 0:  # numpy scalar types other than float64
+            return int(house_positions_core(longitudes.reshape(1), cusps)[0])
+        return house_positions_core(longitudes, cusps)
 
 
@@ -25,6 +25,8 @@ class HoraryConfig:
     
     _instance: Optional['HoraryConfig'] = None
     _config: Optional[SimpleNamespace] = None
+    _flat: Optional[Dict[str, Any]] = None  # Dotted key path -> value
+    _validated_config: Optional[SimpleNamespace] = None
     
     def __new__(cls) -> 'HoraryConfig':
         if cls._instance is None:
@@ -59,6 +61,7 @@ class HoraryConfig:
             
             # Convert nested dict to nested SimpleNamespace for dot notation access
             self._config = self._dict_to_namespace(config_dict)
+            self._flat = self._flatten(self._config)
             
             logger.info(f"Loaded horary configuration from {config_file}")
             
@@ -76,6 +79,16 @@ class HoraryConfig:
         else:
             return d
     
+    def _flatten(self, namespace: SimpleNamespace, prefix: str = '') -> Dict[str, Any]:
+        """Index every section and value of the namespace by its dotted key path"""
+        flat = {}
+        for key, value in vars(namespace).items():
+            path = prefix + key
+            flat[path] = value
+            if isinstance(value, SimpleNamespace):
+                flat.update(self._flatten(value, path + '.'))
+        return flat
+    
     @property
     def config(self) -> SimpleNamespace:
         """Get the configuration namespace"""
@@ -94,12 +107,11 @@ class HoraryConfig:
         Returns:
             Configuration value or default
         """
+        if self._config is None:
+            self._load_config()
         try:
-            value = self.config
-            for key in key_path.split('.'):
-                value = getattr(value, key)
-            return value
-        except AttributeError:
+            return self._flat[key_path]
+        except KeyError:
             if default is not None:
                 return default
             raise HoraryError(f"Configuration key not found: {key_path}")
@@ -117,17 +129,21 @@ class HoraryConfig:
         Raises:
             HoraryError: If key is missing
         """
+        if self._config is None:
+            self._load_config()
         try:
-            value = self.config
-            for key in key_path.split('.'):
-                value = getattr(value, key)
-            return value
-        except AttributeError:
+            return self._flat[key_path]
+        except KeyError:
             raise HoraryError(f"Required configuration key missing: {key_path}")
     
     def validate_required_keys(self) -> None:
         """Validate that all required configuration keys are present"""
         
+        # Already validated this loaded configuration in this process
+        config = self.config
+        if config is self._validated_config:
+            return
+        
         required_keys = [
             'timing.default_moon_speed_fallback',
             'orbs.conjunction',
@@ -148,12 +164,16 @@ class HoraryConfig:
         
         if missing_keys:
             raise HoraryError(f"Missing required configuration keys: {missing_keys}")
+        
+        self._validated_config = config
     
     @classmethod
     def reset(cls) -> None:
         """Reset singleton for testing"""
         cls._instance = None
         cls._config = None
+        cls._flat = None
+        cls._validated_config = None
 
 
 # Global configuration instance
@@ -1,29 +1,62 @@
 # -*- coding: utf-8 -*-
-"""Backward-compatible wrapper for the horary astrology engine."""
-
-from models import (
-    Planet, Aspect, Sign, SolarCondition, SolarAnalysis,
-    PlanetPosition, AspectInfo, LunarAspect, Significator, HoraryChart,
-)
-from question_analysis import TraditionalHoraryQuestionAnalyzer
-from calculator import EnhancedTraditionalAstrologicalCalculator
-from judgment_engine import (
-    TimezoneManager,
-    EnhancedTraditionalHoraryJudgmentEngine,
-    HoraryEngine,
-    load_test_config,
-    validate_configuration,
-    get_configuration_info,
-    HoraryCalculationError,
-    HoraryConfigurationError,
-    setup_horary_logging,
-    profile_calculation,
-    get_engine_info,
-)
-from serialization import serialize_planet_with_solar, serialize_chart_for_frontend
-from _horary_math import LocationError
-
-# Backward-compatible aliases
-TraditionalAstrologicalCalculator = EnhancedTraditionalAstrologicalCalculator
-TraditionalHoraryJudgmentEngine = EnhancedTraditionalHoraryJudgmentEngine
+"""Backward-compatible wrapper for the horary astrology engine.
 
+Names are resolved on first access (PEP 562) so importing this module does
+not load the calculator, judgment engine or their JIT kernels until needed.
+"""
+
+import importlib
+
+# Public name -> (module, attribute)
+_LAZY = {
+    # models
+    "Planet": ("models", "Planet"),
+    "Aspect": ("models", "Aspect"),
+    "Sign": ("models", "Sign"),
+    "SolarCondition": ("models", "SolarCondition"),
+    "SolarAnalysis": ("models", "SolarAnalysis"),
+    "PlanetPosition": ("models", "PlanetPosition"),
+    "PlanetArrays": ("models", "PlanetArrays"),
+    "AspectInfo": ("models", "AspectInfo"),
+    "LunarAspect": ("models", "LunarAspect"),
+    "Significator": ("models", "Significator"),
+    "HoraryChart": ("models", "HoraryChart"),
+    # question analysis and calculation
+    "TraditionalHoraryQuestionAnalyzer": ("question_analysis", "TraditionalHoraryQuestionAnalyzer"),
+    "EnhancedTraditionalAstrologicalCalculator": ("calculator", "EnhancedTraditionalAstrologicalCalculator"),
+    # judgment engine
+    "TimezoneManager": ("judgment_engine", "TimezoneManager"),
+    "EnhancedTraditionalHoraryJudgmentEngine": ("judgment_engine", "EnhancedTraditionalHoraryJudgmentEngine"),
+    "HoraryEngine": ("judgment_engine", "HoraryEngine"),
+    "load_test_config": ("judgment_engine", "load_test_config"),
+    "validate_configuration": ("judgment_engine", "validate_configuration"),
+    "get_configuration_info": ("judgment_engine", "get_configuration_info"),
+    "HoraryCalculationError": ("judgment_engine", "HoraryCalculationError"),
+    "HoraryConfigurationError": ("judgment_engine", "HoraryConfigurationError"),
+    "setup_horary_logging": ("judgment_engine", "setup_horary_logging"),
+    "profile_calculation": ("judgment_engine", "profile_calculation"),
+    "get_engine_info": ("judgment_engine", "get_engine_info"),
+    # serialization and helpers
+    "serialize_planet_with_solar": ("serialization", "serialize_planet_with_solar"),
+    "serialize_chart_for_frontend": ("serialization", "serialize_chart_for_frontend"),
+    "LocationError": ("_horary_math", "LocationError"),
+    # Backward-compatible aliases
+    "TraditionalAstrologicalCalculator": ("calculator", "EnhancedTraditionalAstrologicalCalculator"),
+    "TraditionalHoraryJudgmentEngine": ("judgment_engine", "EnhancedTraditionalHoraryJudgmentEngine"),
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value  # Cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -2,19 +2,25 @@
 """Judgment engine and related utilities for the horary astrology engine."""
 
 import os
+import bisect
 import datetime
+import functools
 import logging
+import threading
+import time
+from operator import itemgetter
 from typing import Dict, List, Tuple, Optional, Any
 
+import numpy as np
 import requests
 import pytz
 try:
-    from zoneinfo import ZoneInfo
+    from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 except ImportError:
     ZoneInfo = None
+    ZoneInfoNotFoundError = None
 
 from timezonefinder import TimezoneFinder
-from geopy.geocoders import Nominatim
 from geopy.exc import GeocoderTimedOut
 import swisseph as swe
 
@@ -31,22 +37,181 @@ from _horary_math import (
     calculate_sign_boundary_longitude, days_to_sign_exit,
     calculate_elongation, is_planet_oriental, sun_altitude_at_civil_twilight,
     calculate_moon_variable_speed, check_aspect_separation_order,
-    LocationError, safe_geocode, normalize_longitude, degrees_to_dms
+    localize_offsets_core, format_timing_description,
+    LocationError, safe_geocode, get_geolocator, NOMINATIM_MIN_DELAY_SECONDS, normalize_longitude, degrees_to_dms
 )
 
 logger = logging.getLogger(__name__)
 
+# Enum members cached once; iterating an Enum is slow compared with a tuple
+_ASPECTS = tuple(Aspect)
+
+# Aspects favorable in themselves, and receptions that make any aspect favorable
+_FAVORABLE_ASPECTS = frozenset((Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE))
+_FAVORABLE_RECEPTIONS = frozenset(("mutual_rulership", "mutual_exaltation", "mixed_reception"))
+
+_ASPECT_DEGREES = np.array([aspect.degrees for aspect in _ASPECTS], dtype=float)
+
+# (aspect, +/-) offsets from a planet at which the Moon perfects each aspect
+_ASPECT_OFFSETS = np.stack((_ASPECT_DEGREES, -_ASPECT_DEGREES), axis=1)
+
+# Moon phase buckets by Sun-Moon elongation: bisect_right(_PHASE_EDGES, e) indexes the tables
+_PHASE_EDGES = (30.0, 60.0, 120.0, 150.0, 210.0, 240.0, 300.0)
+_PHASE_KEYS = ("new_moon", "waxing_crescent", "first_quarter", "waxing_gibbous",
+               "full_moon", "waning_gibbous", "last_quarter", "waning_crescent")
+_PHASE_NAMES = ("New Moon", "Waxing Crescent", "First Quarter", "Waxing Gibbous",
+                "Full Moon", "Waning Gibbous", "Last Quarter", "Waning Crescent")
+
+# Moon speed buckets (degrees/day), indexed the same way
+_MOON_SPEED_EDGES = (11.0, 12.0, 14.0, 15.0)
+_MOON_SPEED_KEYS = ("very_slow", "slow", "average", "fast", "very_fast")
+_MOON_SPEED_NAMES = ("Very Slow", "Slow", "Average", "Fast", "Very Fast")
+
+# House number -> angularity (index 0 unused)
+_HOUSE_KIND = ("cadent",) + ("angular", "succedent", "cadent") * 4
+
+# Array forms of the tables above for batched lookups across many charts
+_PHASE_EDGES_ARR = np.array(_PHASE_EDGES)
+_MOON_SPEED_EDGES_ARR = np.array(_MOON_SPEED_EDGES)
+_HOUSE_KIND_KEYS = ("angular", "succedent", "cadent")
+_HOUSE_KIND_IDX = np.array([_HOUSE_KIND_KEYS.index(kind) for kind in _HOUSE_KIND])
+
+# 28 lunar mansions of 360/28 degrees each
+_MANSION_RECIP = 28.0 / 360.0
+
+# Signs where a void Moon is excused (each toggled by config.moon.void_exceptions.<sign>)
+_VOID_EXCEPTIONS = {
+    Sign.CANCER: "own sign - Cancer",
+    Sign.SAGITTARIUS: "joy - Sagittarius",
+    Sign.TAURUS: "exaltation - Taurus",
+}
+_LILLY_VOID_EXCEPTIONS = frozenset((Sign.CANCER, Sign.TAURUS, Sign.SAGITTARIUS, Sign.PISCES))
+
+# Solar condition -> bucket in the solar factors summary (cazimi, combusted, under beams)
+_SOLAR_BUCKETS = {SolarCondition.CAZIMI: 0, SolarCondition.COMBUSTION: 1, SolarCondition.UNDER_BEAMS: 2}
+# Conditions whose effect the ignore_combustion override removes
+_COMBUSTION_CONDITIONS = frozenset((SolarCondition.COMBUSTION, SolarCondition.UNDER_BEAMS))
+# Enum attributes resolved once (Enum.value goes through a descriptor on every access)
+_PLANET_NAMES = {planet: planet.value for planet in Planet}
+_CONDITION_FIELDS = {condition: (condition.condition_name, condition.dignity_modifier, condition.description)
+                     for condition in SolarCondition}
+
+# Fallback zone for unknown names; attached with replace() like zoneinfo zones
+_UTC = datetime.timezone.utc
+
+
+def _parse_date_time(date_str: str, time_str: str) -> datetime.datetime:
+    """Naive datetime from ``YYYY-MM-DD`` and ``HH:MM``.
+
+    Fixed-width input goes through the C ``fromisoformat``; anything else
+    (single-digit fields, out-of-range values) goes through strptime, so
+    accepted inputs and error messages are unchanged.
+    """
+    if (len(date_str) == 10 and len(time_str) == 5
+            and date_str[4] == date_str[7] == '-' and time_str[2] == ':'):
+        # Only plain ASCII digits, so the fast path accepts nothing strptime would reject
+        digits = date_str[:4] + date_str[5:7] + date_str[8:] + time_str[:2] + time_str[3:]
+        if digits.isascii() and digits.isdigit():
+            try:
+                return datetime.datetime.fromisoformat(f"{date_str}T{time_str}")
+            except ValueError:
+                pass
+    return datetime.datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
+
+
+@functools.lru_cache(maxsize=512)
+def _build_tz(factory, tz_str: str):
+    return factory(tz_str)
+
+
+def _zoneinfo_or_pytz(tz_str: str):
+    try:
+        return ZoneInfo(tz_str)
+    except ZoneInfoNotFoundError:
+        # No system tz database entry (e.g. Windows without tzdata); pytz bundles its own
+        return pytz.timezone(tz_str)
+
+
+def _get_tz(tz_str: str):
+    """Return a cached tzinfo for ``tz_str`` (zoneinfo when available, else pytz).
+
+    Raises for unknown zone names; failures are not cached.
+    """
+    # The factory is part of the key so swapping ZoneInfo/pytz never serves a stale object
+    return _build_tz(_zoneinfo_or_pytz if ZoneInfo else pytz.timezone, tz_str)
+
+
+@functools.lru_cache(maxsize=64)
+def _transition_table(tz_str: str) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """(UTC transition seconds, UTC offset seconds, is-DST) per interval of a pytz zone
+
+    The table is read from pytz's private attributes; None when this pytz build
+    does not provide them. Raises for unknown zone names.
+    """
+    tz = pytz.timezone(tz_str)
+    if not isinstance(tz, pytz.tzinfo.DstTzInfo):
+        # Fixed-offset zone (UTC, Etc/GMT+5, ...): one interval
+        offset = tz.utcoffset(datetime.datetime(2000, 1, 1))
+        return (np.zeros(1, dtype=np.int64), np.array([offset.total_seconds()], dtype=np.int64),
+                np.zeros(1, dtype=bool))
+    transitions = getattr(tz, '_utc_transition_times', None)
+    info = getattr(tz, '_transition_info', None)
+    if transitions is None or info is None:
+        return None
+    return (np.array(transitions, dtype='datetime64[s]').astype(np.int64),
+            np.array([utcoffset.total_seconds() for utcoffset, _, _ in info], dtype=np.int64),
+            np.array([bool(dst) for _, dst, _ in info], dtype=bool))
+
+
+@functools.lru_cache(maxsize=1)
+def get_timezone_finder() -> TimezoneFinder:
+    """Process-wide TimezoneFinder, so its polygon data is loaded once"""
+    # in_memory trades a few tens of MB of RAM for lookups that never touch the data files
+    return TimezoneFinder(in_memory=True)
+
+
+def _normalize_location(location: str) -> str:
+    """Cache key for a location string: lower case, single spaces"""
+    return " ".join(location.lower().split())
+
+
+# Successful geocodes keyed on the normalized location, oldest evicted first
+_GEOCODE_CACHE: Dict[str, Tuple[float, float, str]] = {}
+_GEOCODE_CACHE_SIZE = 2048
+_geocode_cache_lock = threading.Lock()
+
+
+def _cached_geocode(location: str) -> Tuple[float, float, str]:
+    """Geocode ``location`` as typed, memoized on its normalized form"""
+    key = _normalize_location(location)
+    cached = _GEOCODE_CACHE.get(key)
+    if cached is not None:
+        return cached
+    # Failures raise LocationError (quoting the user's text), so only successes are stored
+    result = safe_geocode(location)
+    with _geocode_cache_lock:
+        if len(_GEOCODE_CACHE) >= _GEOCODE_CACHE_SIZE:
+            del _GEOCODE_CACHE[next(iter(_GEOCODE_CACHE))]
+        _GEOCODE_CACHE[key] = result
+    return result
+
 class TimezoneManager:
     """Handles timezone operations for horary calculations"""
     
     def __init__(self):
-        self.tf = TimezoneFinder()
-        self.geolocator = Nominatim(user_agent="horary_astrology_tz")
+        self.tf = get_timezone_finder()
+        self.geolocator = get_geolocator()
+        # Per-instance memo of polygon lookups keyed on rounded coordinates
+        self._timezone_at = functools.lru_cache(maxsize=4096)(self._lookup_timezone)
+    
+    def _lookup_timezone(self, lat: float, lon: float) -> Optional[str]:
+        return self.tf.timezone_at(lat=lat, lng=lon)
     
     def get_timezone_for_location(self, lat: float, lon: float) -> Optional[str]:
         """Get timezone string for given coordinates"""
         try:
-            return self.tf.timezone_at(lat=lat, lng=lon)
+            # 3 decimals (~100 m) is far finer than any timezone boundary
+            return self._timezone_at(round(lat, 3), round(lon, 3))
         except Exception as e:
             logger.error(f"Error getting timezone for {lat}, {lon}: {e}")
             return None
@@ -61,94 +226,134 @@ class TimezoneManager:
             Tuple of (local_datetime, utc_datetime, timezone_used)
         """
         # Combine date and time
-        dt_naive = datetime.datetime.strptime(f"{date_str} {time_str}", "%Y-%m-%d %H:%M")
+        dt_naive = _parse_date_time(date_str, time_str)
         
         # Determine timezone
         if timezone_str:
             # Use provided timezone
             try:
-                if ZoneInfo:
-                    tz = ZoneInfo(timezone_str)
-                else:
-                    tz = pytz.timezone(timezone_str)
+                tz = _get_tz(timezone_str)
                 timezone_used = timezone_str
             except Exception:
                 # Fallback to UTC if invalid timezone
-                tz = pytz.UTC
+                tz = _UTC
                 timezone_used = "UTC"
         elif lat is not None and lon is not None:
             # Get timezone from coordinates
             tz_str = self.get_timezone_for_location(lat, lon)
             if tz_str:
                 try:
-                    if ZoneInfo:
-                        tz = ZoneInfo(tz_str)
-                    else:
-                        tz = pytz.timezone(tz_str)
+                    tz = _get_tz(tz_str)
                     timezone_used = tz_str
                 except Exception:
-                    tz = pytz.UTC
+                    tz = _UTC
                     timezone_used = "UTC"
             else:
-                tz = pytz.UTC
+                tz = _UTC
                 timezone_used = "UTC"
         else:
             # Default to UTC
-            tz = pytz.UTC
+            tz = _UTC
             timezone_used = "UTC"
         
         # Create timezone-aware datetime
-        if ZoneInfo or hasattr(tz, 'localize'):
-            if hasattr(tz, 'localize'):
-                # pytz timezone
-                try:
-                    dt_local = tz.localize(dt_naive)
-                except pytz.AmbiguousTimeError:
-                    # During DST "fall back" - choose first occurrence
-                    dt_local = tz.localize(dt_naive, is_dst=False)
-                    logger.warning(f"Ambiguous time {dt_naive} - using standard time")
-                except pytz.NonExistentTimeError:
-                    # During DST "spring forward" - advance by 1 hour
-                    dt_adjusted = dt_naive + datetime.timedelta(hours=1)
-                    dt_local = tz.localize(dt_adjusted)
-                    logger.warning(f"Non-existent time {dt_naive} - using {dt_adjusted}")
-            else:
-                # zoneinfo timezone
-                dt_local = dt_naive.replace(tzinfo=tz)
-        else:
+        localize = getattr(tz, 'localize', None)
+        if localize is None:
+            # zoneinfo timezone (the usual case): attach directly. Fold 0 already
+            # matches pytz's default localize(is_dst=False) in a "spring forward"
+            # gap; in a "fall back" overlap use the occurrence in standard time.
             dt_local = dt_naive.replace(tzinfo=tz)
+            later = dt_local.replace(fold=1)
+            if later.utcoffset() < dt_local.utcoffset() and dt_local.dst():
+                dt_local = later
+        else:
+            # pytz timezone
+            try:
+                dt_local = localize(dt_naive)
+            except pytz.AmbiguousTimeError:
+                # During DST "fall back" - choose first occurrence
+                dt_local = localize(dt_naive, is_dst=False)
+                logger.warning(f"Ambiguous time {dt_naive} - using standard time")
+            except pytz.NonExistentTimeError:
+                # During DST "spring forward" - advance by 1 hour
+                dt_adjusted = dt_naive + datetime.timedelta(hours=1)
+                dt_local = localize(dt_adjusted)
+                logger.warning(f"Non-existent time {dt_naive} - using {dt_adjusted}")
         
         # Convert to UTC
-        dt_utc = dt_local.astimezone(pytz.UTC)
+        dt_utc = dt_local.astimezone(datetime.timezone.utc)
         
         return dt_local, dt_utc, timezone_used
     
-    def get_current_time_for_location(self, lat: float, lon: float) -> Tuple[datetime.datetime, datetime.datetime, str]:
+    def parse_many(self, dates, times, timezone_str: Optional[str] = None,
+                   lat: Optional[float] = None, lon: Optional[float] = None
+                   ) -> Tuple[np.ndarray, np.ndarray, str]:
+        """
+        Parse many date ("YYYY-MM-DD") and time ("HH:MM") strings in one timezone
+        
+        The timezone is chosen as in parse_datetime_with_timezone, and wall times on
+        DST transitions resolve the same way. Offsets come from pytz's transition
+        table, searched in a JIT loop over the batch, so results follow pytz's
+        bundled database (no rules past 2037) where it differs from the system's.
+        Without that table, each wall time goes through pytz ``localize()``.
+        
+        Returns:
+            Tuple of (local_datetimes, utc_datetimes, timezone_used); the datetimes
+            are naive datetime64[s] arrays aligned with the inputs
+        """
+        stamps = np.char.add(np.char.add(np.asarray(dates, dtype=str), 'T'), np.asarray(times, dtype=str))
+        local = stamps.astype('datetime64[m]').astype('datetime64[s]')
+        
+        if timezone_str:
+            tz_str = timezone_str
+        elif lat is not None and lon is not None:
+            tz_str = self.get_timezone_for_location(lat, lon)
+        else:
+            tz_str = None
+        
+        if tz_str:
+            try:
+                tz = pytz.timezone(tz_str)
+            except Exception:
+                tz_str = None
+        if not tz_str:
+            tz_str, tz = "UTC", pytz.UTC
+        
+        table = _transition_table(tz_str)
+        if table is None:
+            offsets = np.array([tz.localize(dt).utcoffset().total_seconds()
+                                for dt in local.astype(datetime.datetime)], dtype=np.int64)
+        else:
+            offsets = localize_offsets_core(*table, local.astype(np.int64))
+        return local, local - offsets.astype('timedelta64[s]'), tz_str
+    
+    def get_current_time_for_location(self, lat: float, lon: float,
+                                      timezone_str: Optional[str] = None) -> Tuple[datetime.datetime, datetime.datetime, str]:
         """
         Get current time for a specific location
         
+        Args:
+            timezone_str: Timezone already known for the location (skips the lookup)
+        
         Returns:
             Tuple of (local_datetime, utc_datetime, timezone_used)
         """
         # Get timezone for location
-        tz_str = self.get_timezone_for_location(lat, lon)
+        tz_str = timezone_str or self.get_timezone_for_location(lat, lon)
         
         if tz_str:
             try:
-                if ZoneInfo:
-                    tz = ZoneInfo(tz_str)
-                else:
-                    tz = pytz.timezone(tz_str)
+                tz = _get_tz(tz_str)
                 timezone_used = tz_str
             except Exception:
-                tz = pytz.UTC
+                tz = _UTC
                 timezone_used = "UTC"
         else:
-            tz = pytz.UTC
+            tz = _UTC
             timezone_used = "UTC"
         
         # Get current UTC time
-        utc_now = datetime.datetime.now(pytz.UTC)
+        utc_now = datetime.datetime.now(datetime.timezone.utc)
         
         # Convert to local time
         local_now = utc_now.astimezone(tz)
@@ -164,10 +369,9 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         self.calculator = EnhancedTraditionalAstrologicalCalculator()
         self.timezone_manager = TimezoneManager()
         
-        # Enhanced location service
+        # Enhanced location service (shared client, one persistent HTTP session)
         try:
-            from geopy.geocoders import Nominatim
-            self.geolocator = Nominatim(user_agent="enhanced_horary_astrology")
+            self.geolocator = get_geolocator()
         except:
             self.geolocator = None
     
@@ -181,7 +385,9 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                       ignore_combustion: bool = False,
                       ignore_saturn_7th: bool = False,
                       # Legacy reception weighting (now configurable)
-                      exaltation_confidence_boost: float = None) -> Dict[str, Any]:
+                      exaltation_confidence_boost: float = None,
+                      # (lat, lon, tz_str, full_location) already resolved by the caller
+                      resolved_location: Optional[Tuple[float, float, Optional[str], str]] = None) -> Dict[str, Any]:
         """Enhanced Traditional horary judgment with configuration system"""
         
         try:
@@ -190,10 +396,13 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             if exaltation_confidence_boost is None:
                 exaltation_confidence_boost = config.confidence.reception.mutual_exaltation_bonus
             
-            # Fail-fast geocoding
-            if self.geolocator:
+            # Fail-fast geocoding, unless the caller already resolved the location
+            known_tz = None
+            if resolved_location is not None:
+                lat, lon, known_tz, full_location = resolved_location
+            elif self.geolocator:
                 try:
-                    lat, lon, full_location = safe_geocode(location)
+                    lat, lon, full_location = _cached_geocode(location)
                 except LocationError as e:
                     raise e
             else:
@@ -201,12 +410,13 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             
             # Handle datetime with proper timezone support
             if use_current_time:
-                dt_local, dt_utc, timezone_used = self.timezone_manager.get_current_time_for_location(lat, lon)
+                dt_local, dt_utc, timezone_used = self.timezone_manager.get_current_time_for_location(
+                    lat, lon, known_tz)
             else:
                 if not date_str or not time_str:
                     raise ValueError("Date and time must be provided when not using current time")
                 dt_local, dt_utc, timezone_used = self.timezone_manager.parse_datetime_with_timezone(
-                    date_str, time_str, timezone_str, lat, lon)
+                    date_str, time_str, timezone_str or known_tz, lat, lon)
             
             chart = self.calculator.calculate_chart(dt_local, dt_utc, timezone_used, lat, lon, full_location)
             
@@ -222,13 +432,13 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             judgment = self._apply_enhanced_judgment(
                 chart, question_analysis, 
                 ignore_radicality, ignore_void_moon, ignore_combustion, ignore_saturn_7th,
-                exaltation_confidence_boost)
+                exaltation_confidence_boost, config)
             
             # Serialize chart data for frontend
             chart_data_serialized = serialize_chart_for_frontend(chart, chart.solar_analyses)
 
-            general_info = self._calculate_general_info(chart)
-            considerations = self._calculate_considerations(chart, question_analysis)
+            general_info = self._calculate_general_info(chart, config)
+            considerations = self._calculate_considerations(chart, question_analysis, config)
 
             return {
                 "question": question,
@@ -263,17 +473,10 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             }
             
         except LocationError as e:
-            return {
-                "error": str(e),
-                "judgment": "LOCATION_ERROR",
-                "confidence": 0,
-                "reasoning": [f"Location error: {e}"],
-                "error_type": "LocationError"
-            }
+            return self._location_error_result(e)
         except Exception as e:
-            import traceback
-            logger.error(f"Error in judge_question: {e}")
-            logger.error(traceback.format_exc())
+            # Traceback is only formatted if a handler actually emits the record
+            logger.exception("Error in judge_question: %s", e)
             return {
                 "error": str(e),
                 "judgment": "ERROR",
@@ -281,6 +484,91 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 "reasoning": [f"Calculation error: {e}"]
             }
     
+    def judge_many(self, questions: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Judge a batch of questions, geocoding each distinct location once
+        
+        Lookups the geocode cache cannot answer are made one after another, at
+        most one per NOMINATIM_MIN_DELAY_SECONDS.
+        
+        Args:
+            questions: judge_question keyword arguments, one dict per question
+        
+        Returns:
+            Judgment results in the same order as ``questions``
+        """
+        failures = {}
+        
+        if self.geolocator:
+            # Each normalized location is looked up once, as first spelled in the batch
+            locations = {}
+            for q in questions:
+                if q.get("resolved_location") is None:
+                    locations.setdefault(_normalize_location(q["location"]), q["location"])
+            
+            # Warm the geocode cache so the judgments below never wait on the network
+            last_request = None
+            for loc_norm, location in locations.items():
+                if loc_norm in _GEOCODE_CACHE:
+                    continue
+                if last_request is not None:
+                    delay = NOMINATIM_MIN_DELAY_SECONDS - (time.monotonic() - last_request)
+                    if delay > 0:
+                        time.sleep(delay)
+                last_request = time.monotonic()
+                try:
+                    _cached_geocode(location)
+                except LocationError as e:
+                    failures[loc_norm] = e
+        
+        results = []
+        for q in questions:
+            error = None if q.get("resolved_location") else failures.get(_normalize_location(q["location"]))
+            results.append(self._location_error_result(error) if error else self.judge_question(**q))
+        return results
+    
+    # Column order of the flag matrix accepted by judge_variants
+    VARIANT_FLAGS = ("ignore_radicality", "ignore_void_moon", "ignore_combustion", "ignore_saturn_7th")
+    
+    def judge_variants(self, chart: HoraryChart, question_analysis: Dict,
+                       flag_matrix: np.ndarray,
+                       exaltation_confidence_boost: float = None) -> np.ndarray:
+        """
+        Judge one chart under many override combinations
+        
+        Args:
+            chart: Chart to judge
+            question_analysis: Output of the question analyzer for the chart's question
+            flag_matrix: Boolean array of shape (n, 4), columns as in VARIANT_FLAGS
+            exaltation_confidence_boost: Reception boost; configured value when None
+        
+        Returns:
+            Object array of n judgment dicts. Rows with the same flags share one dict.
+        """
+        config = cfg()
+        if exaltation_confidence_boost is None:
+            exaltation_confidence_boost = config.confidence.reception.mutual_exaltation_bonus
+        
+        flags = np.asarray(flag_matrix, dtype=bool).reshape(-1, len(self.VARIANT_FLAGS))
+        # At most 16 distinct combinations, however many rows are requested
+        unique_flags, inverse = np.unique(flags, axis=0, return_inverse=True)
+        
+        judgments = np.empty(len(unique_flags), dtype=object)
+        for i, row in enumerate(unique_flags.tolist()):
+            judgments[i] = self._apply_enhanced_judgment(
+                chart, question_analysis, *row, exaltation_confidence_boost, config)
+        return judgments[inverse.reshape(-1)]
+    
+    @staticmethod
+    def _location_error_result(error: LocationError) -> Dict[str, Any]:
+        return {
+            "error": str(error),
+            "judgment": "LOCATION_ERROR",
+            "confidence": 0,
+            "reasoning": [f"Location error: {error}"],
+            "error_type": "LocationError"
+        }
+    
     def _serialize_lunar_aspect(self, lunar_aspect: Optional[LunarAspect]) -> Optional[Dict]:
         """Serialize LunarAspect for JSON output"""
         if not lunar_aspect:
@@ -297,70 +585,76 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         }
     
     # NEW: Enhanced Moon accidental dignity helpers
-    def _moon_phase_bonus(self, chart: HoraryChart) -> int:
+    def _moon_phase_bonus(self, chart: HoraryChart, config=None) -> int:
         """Calculate Moon phase bonus from configuration"""
         
-        moon_pos = chart.planets[Planet.MOON]
-        sun_pos = chart.planets[Planet.SUN]
-        
-        # Calculate angular distance (elongation)
-        elongation = abs(moon_pos.longitude - sun_pos.longitude)
-        if elongation > 180:
-            elongation = 360 - elongation
-        
-        config = cfg()
+        if config is None:
+            config = cfg()
         
-        # Determine phase and return bonus
-        if 0 <= elongation < 30:
-            return config.moon.phase_bonus.new_moon
-        elif 30 <= elongation < 60:
-            return config.moon.phase_bonus.waxing_crescent
-        elif 60 <= elongation < 120:
-            return config.moon.phase_bonus.first_quarter
-        elif 120 <= elongation < 150:
-            return config.moon.phase_bonus.waxing_gibbous
-        elif 150 <= elongation < 210:
-            return config.moon.phase_bonus.full_moon
-        elif 210 <= elongation < 240:
-            return config.moon.phase_bonus.waning_gibbous
-        elif 240 <= elongation < 300:
-            return config.moon.phase_bonus.last_quarter
-        else:  # 300 <= elongation < 360
-            return config.moon.phase_bonus.waning_crescent
+        # Determine phase from the Sun-Moon elongation and return bonus
+        phase = _PHASE_KEYS[bisect.bisect_right(_PHASE_EDGES, chart.moon_sun_elongation)]
+        return getattr(config.moon.phase_bonus, phase)
     
-    def _moon_speed_bonus(self, chart: HoraryChart) -> int:
+    def _moon_speed_bonus(self, chart: HoraryChart, config=None) -> int:
         """Calculate Moon speed bonus from configuration"""
         
-        moon_speed = abs(chart.planets[Planet.MOON].speed)
-        config = cfg()
+        if config is None:
+            config = cfg()
         
-        if moon_speed < 11.0:
-            return config.moon.speed_bonus.very_slow
-        elif moon_speed < 12.0:
-            return config.moon.speed_bonus.slow
-        elif moon_speed < 14.0:
-            return config.moon.speed_bonus.average
-        elif moon_speed < 15.0:
-            return config.moon.speed_bonus.fast
-        else:
-            return config.moon.speed_bonus.very_fast
+        category = _MOON_SPEED_KEYS[bisect.bisect_right(_MOON_SPEED_EDGES, chart.moon_speed_abs)]
+        return getattr(config.moon.speed_bonus, category)
     
-    def _moon_angularity_bonus(self, chart: HoraryChart) -> int:
+    def _moon_angularity_bonus(self, chart: HoraryChart, config=None) -> int:
         """Calculate Moon angularity bonus from configuration"""
         
-        moon_house = chart.planets[Planet.MOON].house
-        config = cfg()
+        moon_house = chart.moon.house
+        if config is None:
+            config = cfg()
         
-        if moon_house in [1, 4, 7, 10]:
-            return config.moon.angularity_bonus.angular
-        elif moon_house in [2, 5, 8, 11]:
-            return config.moon.angularity_bonus.succedent
-        else:  # cadent houses 3, 6, 9, 12
-            return config.moon.angularity_bonus.cadent
+        return getattr(config.moon.angularity_bonus, _HOUSE_KIND[moon_house])
+
+    def _moon_accidentals(self, chart: HoraryChart, config=None) -> Dict[str, int]:
+        """Moon phase, speed and angularity bonuses in one pass, cached on the chart per config"""
+        if config is None:
+            config = cfg()
+        cached = chart.moon_accidentals_cache
+        if cached is not None and cached[0] is config:
+            return cached[1]
+        
+        accidentals = {
+            "phase_bonus": self._moon_phase_bonus(chart, config),
+            "speed_bonus": self._moon_speed_bonus(chart, config),
+            "angularity_bonus": self._moon_angularity_bonus(chart, config)
+        }
+        chart.moon_accidentals_cache = (config, accidentals)
+        return accidentals
+
+    def moon_accidentals_many(self, charts: List[HoraryChart], config=None) -> Dict[str, np.ndarray]:
+        """Moon phase, speed and angularity bonuses for many charts at once
+
+        Same buckets as the per-chart helpers; each result is an array aligned with ``charts``.
+        """
+        if config is None:
+            config = cfg()
+        moon = config.moon
+        phase_table = np.array([getattr(moon.phase_bonus, key) for key in _PHASE_KEYS])
+        speed_table = np.array([getattr(moon.speed_bonus, key) for key in _MOON_SPEED_KEYS])
+        house_table = np.array([getattr(moon.angularity_bonus, key) for key in _HOUSE_KIND_KEYS])
+
+        elongations = np.array([chart.moon_sun_elongation for chart in charts], dtype=float)
+        speeds = np.array([chart.moon_speed_abs for chart in charts], dtype=float)
+        houses = np.array([chart.moon.house for chart in charts], dtype=np.intp)
+
+        # side='right' matches bisect_right: a value on an edge belongs to the upper bucket
+        return {
+            "phase_bonus": phase_table[np.searchsorted(_PHASE_EDGES_ARR, elongations, side='right')],
+            "speed_bonus": speed_table[np.searchsorted(_MOON_SPEED_EDGES_ARR, speeds, side='right')],
+            "angularity_bonus": house_table[_HOUSE_KIND_IDX[houses]]
+        }
 
     # ---------------- General Info Helpers -----------------
 
-    PLANET_SEQUENCE = [
+    PLANET_SEQUENCE = (
         Planet.SATURN,
         Planet.JUPITER,
         Planet.MARS,
@@ -368,19 +662,23 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         Planet.VENUS,
         Planet.MERCURY,
         Planet.MOON,
-    ]
+    )
+
+    # Indexed by datetime.weekday()
+    PLANETARY_DAY_RULERS = (
+        Planet.MOON,      # Monday
+        Planet.MARS,      # Tuesday
+        Planet.MERCURY,   # Wednesday
+        Planet.JUPITER,   # Thursday
+        Planet.VENUS,     # Friday
+        Planet.SATURN,    # Saturday
+        Planet.SUN        # Sunday
+    )
 
-    PLANETARY_DAY_RULERS = {
-        0: Planet.MOON,      # Monday
-        1: Planet.MARS,      # Tuesday
-        2: Planet.MERCURY,   # Wednesday
-        3: Planet.JUPITER,   # Thursday
-        4: Planet.VENUS,     # Friday
-        5: Planet.SATURN,    # Saturday
-        6: Planet.SUN        # Sunday
-    }
+    # Position of each day ruler in PLANET_SEQUENCE (first planetary hour)
+    _DAY_RULER_START = tuple(map(PLANET_SEQUENCE.index, PLANETARY_DAY_RULERS))
 
-    LUNAR_MANSIONS = [
+    LUNAR_MANSIONS = (
         "Al Sharatain", "Al Butain", "Al Thurayya", "Al Dabaran",
         "Al Hak'ah", "Al Han'ah", "Al Dhira", "Al Nathrah",
         "Al Tarf", "Al Jabhah", "Al Zubrah", "Al Sarfah",
@@ -389,64 +687,33 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         "Al Baldah", "Sa'd al Dhabih", "Sa'd Bula", "Sa'd al Su'ud",
         "Sa'd al Akhbiya", "Al Fargh al Mukdim", "Al Fargh al Thani",
         "Batn al Hut"
-    ]
+    )
 
     def _get_moon_phase_name(self, chart: HoraryChart) -> str:
         """Return textual Moon phase name"""
-        moon_pos = chart.planets[Planet.MOON]
-        sun_pos = chart.planets[Planet.SUN]
-
-        elongation = abs(moon_pos.longitude - sun_pos.longitude)
-        if elongation > 180:
-            elongation = 360 - elongation
-
-        if 0 <= elongation < 30:
-            return "New Moon"
-        elif 30 <= elongation < 60:
-            return "Waxing Crescent"
-        elif 60 <= elongation < 120:
-            return "First Quarter"
-        elif 120 <= elongation < 150:
-            return "Waxing Gibbous"
-        elif 150 <= elongation < 210:
-            return "Full Moon"
-        elif 210 <= elongation < 240:
-            return "Waning Gibbous"
-        elif 240 <= elongation < 300:
-            return "Last Quarter"
-        else:
-            return "Waning Crescent"
+        return _PHASE_NAMES[bisect.bisect_right(_PHASE_EDGES, chart.moon_sun_elongation)]
 
     def _moon_speed_category(self, speed: float) -> str:
         """Return a text category for Moon's speed"""
-        speed = abs(speed)
-        if speed < 11.0:
-            return "Very Slow"
-        elif speed < 12.0:
-            return "Slow"
-        elif speed < 14.0:
-            return "Average"
-        elif speed < 15.0:
-            return "Fast"
-        else:
-            return "Very Fast"
+        return _MOON_SPEED_NAMES[bisect.bisect_right(_MOON_SPEED_EDGES, abs(speed))]
 
-    def _calculate_general_info(self, chart: HoraryChart) -> Dict[str, Any]:
+    def _calculate_general_info(self, chart: HoraryChart, config=None) -> Dict[str, Any]:
         """Calculate general chart information for frontend display"""
         dt_local = chart.date_time
         weekday = dt_local.weekday()
-        day_ruler = self.PLANETARY_DAY_RULERS.get(weekday, Planet.SUN)
+        day_ruler = self.PLANETARY_DAY_RULERS[weekday]
 
         hour_index = dt_local.hour
-        start_idx = self.PLANET_SEQUENCE.index(day_ruler)
+        start_idx = self._DAY_RULER_START[weekday]
         hour_ruler = self.PLANET_SEQUENCE[(start_idx + hour_index) % 7]
 
-        moon_pos = chart.planets[Planet.MOON]
+        moon_pos = chart.moon
 
-        mansion_index = int((moon_pos.longitude % 360) / (360 / 28)) + 1
+        # min() guards the rounding case where a longitude just below 360° scales to 28.0
+        mansion_index = min(int((moon_pos.longitude % 360.0) * _MANSION_RECIP), 27) + 1
         mansion_name = self.LUNAR_MANSIONS[mansion_index - 1]
 
-        void_info = self._is_moon_void_of_course_enhanced(chart)
+        void_info = self._is_moon_void_of_course_enhanced(chart, config)
 
         return {
             "planetary_day": day_ruler.value,
@@ -459,16 +726,17 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             "moon_condition": {
                 "sign": moon_pos.sign.sign_name,
                 "speed": moon_pos.speed,
-                "speed_category": self._moon_speed_category(moon_pos.speed),
+                "speed_category": self._moon_speed_category(chart.moon_speed_abs),
                 "void_of_course": void_info["void"],
                 "void_reason": void_info["reason"],
             }
         }
 
-    def _calculate_considerations(self, chart: HoraryChart, question_analysis: Dict) -> Dict[str, Any]:
+    def _calculate_considerations(self, chart: HoraryChart, question_analysis: Dict,
+                                  config=None) -> Dict[str, Any]:
         """Return standard horary considerations"""
-        radicality = self._check_enhanced_radicality(chart)
-        moon_void = self._is_moon_void_of_course_enhanced(chart)
+        radicality = self._check_enhanced_radicality(chart, config=config)
+        moon_void = self._is_moon_void_of_course_enhanced(chart, config)
 
         return {
             "radical": radicality["valid"],
@@ -483,16 +751,18 @@ class EnhancedTraditionalHoraryJudgmentEngine:
     def _apply_enhanced_judgment(self, chart: HoraryChart, question_analysis: Dict,
                                ignore_radicality: bool = False, ignore_void_moon: bool = False,
                                ignore_combustion: bool = False, ignore_saturn_7th: bool = False,
-                               exaltation_confidence_boost: float = 15.0) -> Dict[str, Any]:
+                               exaltation_confidence_boost: float = 15.0,
+                               config=None) -> Dict[str, Any]:
         """Enhanced judgment with configuration system"""
         
         reasoning = []
-        config = cfg()
+        if config is None:
+            config = cfg()
         confidence = config.confidence.base_confidence
         
         # 1. Enhanced radicality with configuration
         if not ignore_radicality:
-            radicality = self._check_enhanced_radicality(chart, ignore_saturn_7th)
+            radicality = self._check_enhanced_radicality(chart, ignore_saturn_7th, config)
             if not radicality["valid"]:
                 return {
                     "result": "NOT RADICAL",
@@ -536,7 +806,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         
         # 3. Enhanced perfection check
         perfection = self._check_enhanced_perfection(chart, querent_planet, quesited_planet, 
-                                                   exaltation_confidence_boost)
+                                                   exaltation_confidence_boost, config=config)
         
         if perfection["perfects"]:
             result = "YES" if perfection["favorable"] else "NO"
@@ -561,7 +831,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             }
         
         # 4. Enhanced denial conditions (retrograde now configurable)
-        denial = self._check_enhanced_denial_conditions(chart, querent_planet, quesited_planet)
+        denial = self._check_enhanced_denial_conditions(chart, querent_planet, quesited_planet, config)
         if denial["denied"]:
             return {
                 "result": "NO",
@@ -572,20 +842,22 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             }
         
         # 5. Enhanced Moon's testimony with configurable void checking
+        moon_accidentals = self._moon_accidentals(chart, config)
         moon_testimony = self._check_enhanced_moon_testimony(chart, querent_planet, quesited_planet, 
-                                                           ignore_void_moon)
+                                                           ignore_void_moon, config, moon_accidentals)
         reasoning.append(f"Moon: {moon_testimony['reason']}")
         
         # Apply configured confidence caps
+        caps = config.confidence.lunar_confidence_caps
         if moon_testimony["favorable"]:
             result = "YES"
-            confidence = min(confidence, config.confidence.lunar_confidence_caps.favorable)
+            confidence = min(confidence, caps.favorable)
         elif moon_testimony["unfavorable"]:
             result = "NO"
-            confidence = min(confidence, config.confidence.lunar_confidence_caps.unfavorable)
+            confidence = min(confidence, caps.unfavorable)
         else:
             result = "UNCLEAR"
-            confidence = min(confidence, config.confidence.lunar_confidence_caps.neutral)
+            confidence = min(confidence, caps.neutral)
         
         return {
             "result": result,
@@ -595,37 +867,36 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             "traditional_factors": {
                 "moon_void": moon_testimony.get("void_of_course", False),
                 "significator_strength": f"Querent: {chart.planets[querent_planet].dignity_score:+d}, Quesited: {chart.planets[quesited_planet].dignity_score:+d}",
-                "moon_accidentals": {
-                    "phase_bonus": self._moon_phase_bonus(chart),
-                    "speed_bonus": self._moon_speed_bonus(chart),
-                    "angularity_bonus": self._moon_angularity_bonus(chart)
-                }
+                "moon_accidentals": dict(moon_accidentals)  # the cached dict stays private
             },
             "solar_factors": solar_factors
         }
     
-    def _check_enhanced_radicality(self, chart: HoraryChart, ignore_saturn_7th: bool = False) -> Dict[str, Any]:
+    def _check_enhanced_radicality(self, chart: HoraryChart, ignore_saturn_7th: bool = False,
+                                   config=None) -> Dict[str, Any]:
         """Enhanced radicality checks with configuration"""
         
-        config = cfg()
-        asc_degree = chart.ascendant % 30
+        if config is None:
+            config = cfg()
+        radicality = config.radicality
+        asc_degree = chart.asc_deg_in_sign
         
         # Too early
-        if asc_degree < config.radicality.asc_too_early:
+        if asc_degree < radicality.asc_too_early:
             return {
                 "valid": False,
                 "reason": f"Ascendant too early at {asc_degree:.1f}° - question premature or not mature"
             }
         
         # Too late
-        if asc_degree > config.radicality.asc_too_late:
+        if asc_degree > radicality.asc_too_late:
             return {
                 "valid": False,
                 "reason": f"Ascendant too late at {asc_degree:.1f}° - question too late or already decided"
             }
         
         # Saturn in 7th house (configurable)
-        if config.radicality.saturn_7th_enabled and not ignore_saturn_7th:
+        if radicality.saturn_7th_enabled and not ignore_saturn_7th:
             saturn_pos = chart.planets[Planet.SATURN]
             if saturn_pos.house == 7:
                 return {
@@ -634,11 +905,11 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 }
         
         # Via Combusta (configurable)
-        if config.radicality.via_combusta_enabled:
-            moon_pos = chart.planets[Planet.MOON]
-            moon_degree_in_sign = moon_pos.longitude % 30
+        if radicality.via_combusta_enabled:
+            moon_pos = chart.moon
+            moon_degree_in_sign = chart.moon_deg_in_sign
             
-            via_combusta = config.radicality.via_combusta
+            via_combusta = radicality.via_combusta
             
             if ((moon_pos.sign == Sign.LIBRA and moon_degree_in_sign > via_combusta.libra_start) or
                 (moon_pos.sign == Sign.SCORPIO and via_combusta.scorpio_full) or
@@ -653,19 +924,22 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             "reason": f"Chart is radical - Ascendant at {asc_degree:.1f}°"
         }
     
-    def _check_enhanced_denial_conditions(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> Dict[str, Any]:
+    def _check_enhanced_denial_conditions(self, chart: HoraryChart, querent: Planet, quesited: Planet,
+                                          config=None) -> Dict[str, Any]:
         """Enhanced denial conditions with configurable retrograde handling"""
         
-        config = cfg()
+        if config is None:
+            config = cfg()
         
         # Prohibition - Saturn aspects significators before they perfect
-        for aspect in chart.aspects:
+        # (only possible when the significators themselves are applying)
+        sig_aspect = chart.applying_aspect(querent, quesited)
+        for aspect in chart.aspects if sig_aspect else ():
             if (aspect.planet1 == Planet.SATURN or aspect.planet2 == Planet.SATURN) and aspect.applying:
                 other_planet = aspect.planet2 if aspect.planet1 == Planet.SATURN else aspect.planet1
                 
-                if other_planet in [querent, quesited]:
-                    sig_aspect = self._find_applying_aspect(chart, querent, quesited)
-                    if sig_aspect and aspect.degrees_to_exact < sig_aspect["degrees_to_exact"]:
+                if other_planet in (querent, quesited):
+                    if aspect.degrees_to_exact < sig_aspect.degrees_to_exact:
                         return {
                             "denied": True,
                             "confidence": config.confidence.denial.prohibition,
@@ -692,75 +966,86 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         
         return {"denied": False}
     
-    def _check_enhanced_translation_of_light(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> Dict[str, Any]:
+    def _check_enhanced_translation_of_light(self, chart: HoraryChart, querent: Planet, quesited: Planet,
+                                             config=None) -> Dict[str, Any]:
         """Enhanced translation with configurable speed requirement removal"""
         
-        config = cfg()
+        if config is None:
+            config = cfg()
         translation_config = config.moon.translation
         
         # Remove speed prerequisite if configured
         if not translation_config.require_speed_advantage:
             # Check all planets regardless of speed
+            skip = {querent, quesited}
+            querent_pos = chart.planets[querent]
+            quesited_pos = chart.planets[quesited]
+            querent_lon, querent_speed = querent_pos.longitude, querent_pos.speed
+            quesited_lon, quesited_speed = quesited_pos.longitude, quesited_pos.speed
+            jd = chart.julian_day
             for planet, pos in chart.planets.items():
-                if planet in [querent, quesited]:
+                if planet in skip:
                     continue
                 
                 # Check aspects to both significators
-                aspect_to_querent = self._find_applying_aspect(chart, planet, querent)
-                aspect_to_quesited = self._find_applying_aspect(chart, planet, quesited)
+                aspect_to_querent = chart.applying_aspect(planet, querent)
+                if aspect_to_querent is None:
+                    continue
+                aspect_to_quesited = chart.applying_aspect(planet, quesited)
+                if aspect_to_quesited is None:
+                    continue
                 
                 # Enhanced: Check separation order if required
-                if aspect_to_querent and aspect_to_quesited:
-                    if translation_config.require_proper_sequence:
-                        # Check proper sequence: separate from one, then apply to other
-                        querent_separation = check_aspect_separation_order(
-                            chart.planets[querent].longitude, chart.planets[querent].speed,
-                            pos.longitude, pos.speed,
-                            aspect_to_querent["aspect"].degrees, chart.julian_day)
-                        
+                if translation_config.require_proper_sequence:
+                    # Check proper sequence: separate from one, then apply to other
+                    querent_separation = check_aspect_separation_order(
+                        querent_lon, querent_speed, pos.longitude, pos.speed,
+                        aspect_to_querent.aspect.degrees, jd)
+                    
+                    # Proper translation sequence
+                    if (querent_separation["is_separating"] and 
+                        aspect_to_quesited.degrees_to_exact < aspect_to_querent.degrees_to_exact):
+                        return {
+                            "found": True,
+                            "translator": planet,
+                            "favorable": True,
+                            "sequence": f"separating from {querent.value}, applying to {quesited.value}"
+                        }
+                    
+                    if aspect_to_querent.degrees_to_exact < aspect_to_quesited.degrees_to_exact:
                         quesited_separation = check_aspect_separation_order(
-                            chart.planets[quesited].longitude, chart.planets[quesited].speed,
-                            pos.longitude, pos.speed,
-                            aspect_to_quesited["aspect"].degrees, chart.julian_day)
-                        
-                        # Proper translation sequence
-                        if (querent_separation["is_separating"] and 
-                            aspect_to_quesited["degrees_to_exact"] < aspect_to_querent["degrees_to_exact"]):
-                            return {
-                                "found": True,
-                                "translator": planet,
-                                "favorable": True,
-                                "sequence": f"separating from {querent.value}, applying to {quesited.value}"
-                            }
-                        elif (quesited_separation["is_separating"] and 
-                              aspect_to_querent["degrees_to_exact"] < aspect_to_quesited["degrees_to_exact"]):
+                            quesited_lon, quesited_speed, pos.longitude, pos.speed,
+                            aspect_to_quesited.aspect.degrees, jd)
+                        if quesited_separation["is_separating"]:
                             return {
                                 "found": True,
                                 "translator": planet,
                                 "favorable": True,
                                 "sequence": f"separating from {quesited.value}, applying to {querent.value}"
                             }
-                    else:
-                        # Simple translation without sequence requirement
-                        return {
-                            "found": True,
-                            "translator": planet,
-                            "favorable": True,
-                            "sequence": f"connecting {querent.value} and {quesited.value}"
-                        }
+                else:
+                    # Simple translation without sequence requirement
+                    return {
+                        "found": True,
+                        "translator": planet,
+                        "favorable": True,
+                        "sequence": f"connecting {querent.value} and {quesited.value}"
+                    }
         
         return {"found": False}
     
     def _check_enhanced_moon_testimony(self, chart: HoraryChart, querent: Planet, quesited: Planet,
-                                     ignore_void_moon: bool = False) -> Dict[str, Any]:
+                                     ignore_void_moon: bool = False, config=None,
+                                     moon_accidentals: Optional[Dict[str, int]] = None) -> Dict[str, Any]:
         """Enhanced Moon testimony with configurable void-of-course methods"""
         
-        moon_pos = chart.planets[Planet.MOON]
-        config = cfg()
+        moon_pos = chart.moon
+        if config is None:
+            config = cfg()
         
         # Check if Moon is void of course using configured method
         if not ignore_void_moon:
-            void_check = self._is_moon_void_of_course_enhanced(chart)
+            void_check = self._is_moon_void_of_course_enhanced(chart, config)
             if void_check["void"] and not void_check["exception"]:
                 return {
                     "favorable": False,
@@ -779,11 +1064,10 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             }
         
         # Enhanced Moon analysis with accidental dignities
-        phase_bonus = self._moon_phase_bonus(chart)
-        speed_bonus = self._moon_speed_bonus(chart)
-        angularity_bonus = self._moon_angularity_bonus(chart)
+        if moon_accidentals is None:
+            moon_accidentals = self._moon_accidentals(chart, config)
         
-        total_moon_bonus = phase_bonus + speed_bonus + angularity_bonus
+        total_moon_bonus = sum(moon_accidentals.values())
         adjusted_dignity = moon_pos.dignity_score + total_moon_bonus
         
         # Moon's next aspect using enhanced calculation
@@ -793,8 +1077,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             other_planet = next_aspect.planet
             aspect_type = next_aspect.aspect
             
-            if other_planet in [querent, quesited]:
-                favorable = aspect_type in [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
+            if other_planet in (querent, quesited):
+                favorable = aspect_type in _FAVORABLE_ASPECTS
                 
                 return {
                     "favorable": favorable,
@@ -827,34 +1111,35 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             "void_of_course": False
         }
     
-    def _is_moon_void_of_course_enhanced(self, chart: HoraryChart) -> Dict[str, Any]:
+    def _is_moon_void_of_course_enhanced(self, chart: HoraryChart, config=None) -> Dict[str, Any]:
         """Enhanced void of course check with configurable methods"""
         
-        moon_pos = chart.planets[Planet.MOON]
-        config = cfg()
+        if config is None:
+            config = cfg()
         void_rule = config.moon.void_rule
         
         if void_rule == "by_sign":
-            return self._void_by_sign_method(chart)
+            return self._void_by_sign_method(chart, config)
         elif void_rule == "by_orb":
-            return self._void_by_orb_method(chart)
+            return self._void_by_orb_method(chart, config)
         elif void_rule == "lilly":
-            return self._void_lilly_method(chart)
+            return self._void_lilly_method(chart, config)
         else:
             logger.warning(f"Unknown void rule: {void_rule}, defaulting to by_sign")
-            return self._void_by_sign_method(chart)
+            return self._void_by_sign_method(chart, config)
     
-    def _void_by_sign_method(self, chart: HoraryChart) -> Dict[str, Any]:
+    def _void_by_sign_method(self, chart: HoraryChart, config=None) -> Dict[str, Any]:
         """Traditional void-of-course by sign boundary method"""
         
-        moon_pos = chart.planets[Planet.MOON]
-        config = cfg()
+        moon_pos = chart.moon
+        if config is None:
+            config = cfg()
         
         # Calculate degrees left in current sign
-        moon_degree_in_sign = moon_pos.longitude % 30
+        moon_degree_in_sign = chart.moon_deg_in_sign
         degrees_left_in_sign = 30 - moon_degree_in_sign
         
-        if abs(moon_pos.speed) < config.timing.stationary_speed_threshold:
+        if chart.moon_speed_abs < config.timing.stationary_speed_threshold:
             return {
                 "void": False,
                 "exception": False,
@@ -862,58 +1147,36 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 "degrees_left_in_sign": degrees_left_in_sign
             }
         
-        # Find future aspects in current sign
-        future_aspects = []
+        # Find future aspects in current sign: every (planet, aspect, +/-) Moon
+        # longitude that perfects an aspect, kept if it lies ahead of the Moon in this sign
+        arrays = chart.planet_arrays
+        is_other = np.array([planet != Planet.MOON for planet in arrays.planets], dtype=bool)
+        others = [planet for planet in arrays.planets if planet != Planet.MOON]
+        targets = (arrays.lon[is_other][:, None, None] + _ASPECT_OFFSETS) % 360
         
-        for planet, planet_pos in chart.planets.items():
-            if planet == Planet.MOON:
-                continue
-            
-            for aspect_type in Aspect:
-                target_moon_positions = self._calculate_aspect_positions(
-                    planet_pos.longitude, aspect_type, moon_pos.sign)
-                
-                for target_position in target_moon_positions:
-                    target_degree_in_sign = target_position % 30
-                    
-                    if target_degree_in_sign > moon_degree_in_sign:
-                        degrees_to_target = target_degree_in_sign - moon_degree_in_sign
-                        
-                        if degrees_to_target < degrees_left_in_sign:
-                            future_aspects.append({
-                                "planet": planet,
-                                "aspect": aspect_type,
-                                "target_degree": target_degree_in_sign,
-                                "degrees_to_reach": degrees_to_target
-                            })
+        sign_start = moon_pos.sign.start_degree
+        target_degrees = targets % 30
+        degrees_to_reach = target_degrees - moon_degree_in_sign
+        ahead = ((targets >= sign_start) & (targets < sign_start + 30) &
+                 (target_degrees > moon_degree_in_sign) & (degrees_to_reach < degrees_left_in_sign))
         
         # Traditional exceptions
-        void_exceptions = config.moon.void_exceptions
-        exceptions = False
+        exception_note = _VOID_EXCEPTIONS.get(moon_pos.sign)
+        exceptions = bool(exception_note and
+                          getattr(config.moon.void_exceptions, moon_pos.sign.name.lower(), False))
         
-        if moon_pos.sign == Sign.CANCER and void_exceptions.cancer:
-            exceptions = True
-        elif moon_pos.sign == Sign.SAGITTARIUS and void_exceptions.sagittarius:
-            exceptions = True
-        elif moon_pos.sign == Sign.TAURUS and void_exceptions.taurus:
-            exceptions = True
-        
-        has_future_aspects = len(future_aspects) > 0
-        is_void = not has_future_aspects
+        is_void = not ahead.any()
         
         if is_void:
             reason = f"Moon makes no more aspects before leaving {moon_pos.sign.sign_name}"
         else:
-            next_aspect = min(future_aspects, key=lambda x: x["degrees_to_reach"])
-            reason = f"Moon will {next_aspect['aspect'].display_name.lower()} {next_aspect['planet'].value} at {next_aspect['target_degree']:.1f}° {moon_pos.sign.sign_name}"
+            # argmin keeps the first of equal candidates, in planet/aspect order
+            nearest = np.unravel_index(np.where(ahead, degrees_to_reach, np.inf).argmin(), ahead.shape)
+            planet, aspect_type = others[nearest[0]], _ASPECTS[nearest[1]]
+            reason = f"Moon will {aspect_type.display_name.lower()} {planet.value} at {target_degrees[nearest]:.1f}° {moon_pos.sign.sign_name}"
         
         if exceptions:
-            if moon_pos.sign == Sign.CANCER:
-                reason += " (but in own sign - Cancer)"
-            elif moon_pos.sign == Sign.SAGITTARIUS:
-                reason += " (but in joy - Sagittarius)"
-            elif moon_pos.sign == Sign.TAURUS:
-                reason += " (but in exaltation - Taurus)"
+            reason += f" (but in {exception_note})"
         
         return {
             "void": is_void,
@@ -922,30 +1185,61 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             "degrees_left_in_sign": degrees_left_in_sign
         }
     
-    def _void_by_orb_method(self, chart: HoraryChart) -> Dict[str, Any]:
+    def moon_void_many(self, jds: np.ndarray, config=None) -> np.ndarray:
+        """By-sign void-of-course flag for the Moon at many Julian days (UT) at once
+
+        Same test as _void_by_sign_method, run across a time grid without building
+        charts; the result is a bool array aligned with ``jds``. Sign exceptions are
+        not applied, matching that method's "void" value.
+        """
+        if config is None:
+            config = cfg()
+        jds = np.asarray(jds, dtype=float)
+        planets = tuple(self.calculator.planets_swe)
+        rows = np.empty((len(jds), len(planets), 6))
+        for i, jd in enumerate(jds):
+            rows[i] = self.calculator._calculate_planet_rows(float(jd))
+
+        moon_index = planets.index(Planet.MOON)
+        is_other = np.array([planet != Planet.MOON for planet in planets], dtype=bool)
+        moon_lon = rows[:, moon_index, 0]
+        moon_degree_in_sign = (moon_lon % 30)[:, None, None, None]
+        sign_start = (moon_lon // 30 * 30)[:, None, None, None]
+
+        # (chart, planet, aspect, +/-) grid of Moon longitudes that perfect an aspect
+        targets = (rows[:, is_other, 0][:, :, None, None] + _ASPECT_OFFSETS) % 360
+        target_degrees = targets % 30
+        ahead = ((targets >= sign_start) & (targets < sign_start + 30) &
+                 (target_degrees > moon_degree_in_sign) &
+                 (target_degrees - moon_degree_in_sign < 30 - moon_degree_in_sign))
+
+        stationary = np.abs(rows[:, moon_index, 3]) < config.timing.stationary_speed_threshold
+        return ~ahead.any(axis=(1, 2, 3)) & ~stationary
+
+    def _void_by_orb_method(self, chart: HoraryChart, config=None) -> Dict[str, Any]:
         """Void-of-course by orb method"""
         
-        moon_pos = chart.planets[Planet.MOON]
-        config = cfg()
+        moon_pos = chart.moon
+        if config is None:
+            config = cfg()
         void_orb = config.orbs.void_orb_deg
         
-        # Check if Moon is within orb of any aspect
-        for planet, planet_pos in chart.planets.items():
-            if planet == Planet.MOON:
-                continue
-            
-            separation = abs(moon_pos.longitude - planet_pos.longitude)
-            if separation > 180:
-                separation = 360 - separation
-            
-            for aspect_type in Aspect:
-                orb_diff = abs(separation - aspect_type.degrees)
-                if orb_diff <= void_orb:
-                    return {
-                        "void": False,
-                        "exception": False,
-                        "reason": f"Moon within {void_orb}° orb of {aspect_type.display_name} to {planet.value}"
-                    }
+        # Check if Moon is within orb of any aspect: one (planet, aspect) grid of orbs
+        arrays = chart.planet_arrays
+        is_other = np.array([planet != Planet.MOON for planet in arrays.planets], dtype=bool)
+        others = [planet for planet in arrays.planets if planet != Planet.MOON]
+        moon_index = arrays.planets.index(Planet.MOON)
+        separations = arrays.pairwise_separation()[moon_index, is_other]
+        in_orb = np.abs(separations[:, None] - _ASPECT_DEGREES) <= void_orb
+        
+        if in_orb.any():
+            # argmax finds the first hit, in planet/aspect order
+            planet_idx, aspect_idx = np.unravel_index(in_orb.argmax(), in_orb.shape)
+            return {
+                "void": False,
+                "exception": False,
+                "reason": f"Moon within {void_orb}° orb of {_ASPECTS[aspect_idx].display_name} to {others[planet_idx].value}"
+            }
         
         return {
             "void": True,
@@ -953,19 +1247,18 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             "reason": f"Moon not within {void_orb}° of any aspect"
         }
     
-    def _void_lilly_method(self, chart: HoraryChart) -> Dict[str, Any]:
+    def _void_lilly_method(self, chart: HoraryChart, config=None) -> Dict[str, Any]:
         """William Lilly's void-of-course method"""
         
         # Lilly's method: Moon is void if it makes no more aspects before changing sign,
         # except when in Cancer, Taurus, Sagittarius, or Pisces
-        moon_pos = chart.planets[Planet.MOON]
+        moon_pos = chart.moon
         
         # Lilly's exceptions
-        lilly_exceptions = [Sign.CANCER, Sign.TAURUS, Sign.SAGITTARIUS, Sign.PISCES]
-        exception = moon_pos.sign in lilly_exceptions
+        exception = moon_pos.sign in _LILLY_VOID_EXCEPTIONS
         
         # Use sign method for the actual calculation
-        void_result = self._void_by_sign_method(chart)
+        void_result = self._void_by_sign_method(chart, config)
         void_result["exception"] = exception
         
         if exception:
@@ -973,79 +1266,49 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         
         return void_result
     
-    def _calculate_aspect_positions(self, planet_longitude: float, aspect: Aspect, moon_sign: Sign) -> List[float]:
-        """Calculate aspect positions (preserved from original)"""
-        positions = []
-        
-        aspect_positions = [
-            (planet_longitude + aspect.degrees) % 360,
-            (planet_longitude - aspect.degrees) % 360
-        ]
-        
-        sign_start = moon_sign.start_degree
-        sign_end = (sign_start + 30) % 360
-        
-        for pos in aspect_positions:
-            pos_normalized = pos % 360
-            
-            if sign_start < sign_end:
-                if sign_start <= pos_normalized < sign_end:
-                    positions.append(pos_normalized)
-            else:  
-                if pos_normalized >= sign_start or pos_normalized < sign_end:
-                    positions.append(pos_normalized)
-        
-        return positions
-    
     def _build_moon_story(self, chart: HoraryChart) -> List[Dict]:
         """Enhanced Moon story with real timing calculations"""
         
-        moon_pos = chart.planets[Planet.MOON]
+        moon_pos = chart.moon
         moon_speed = self.calculator.get_real_moon_speed(chart.julian_day)
         
-        # Get current aspects
-        current_moon_aspects = []
+        # Get current aspects as (sort key, entry): timing for applying aspects, orb for separating
+        keyed_aspects = []
         for aspect in chart.aspects:
-            if Planet.MOON in [aspect.planet1, aspect.planet2]:
-                other_planet = aspect.planet2 if aspect.planet1 == Planet.MOON else aspect.planet1
-                
-                # Enhanced timing using real Moon speed
-                if aspect.applying:
-                    timing_days = aspect.degrees_to_exact / moon_speed if moon_speed > 0 else 0
-                    timing_estimate = self._format_timing_description_enhanced(timing_days)
-                else:
-                    timing_estimate = "Past"
-                    timing_days = 0
-                
-                current_moon_aspects.append({
-                    "planet": other_planet.value,
-                    "aspect": aspect.aspect.display_name,
-                    "orb": float(aspect.orb),
-                    "applying": bool(aspect.applying),
-                    "status": "applying" if aspect.applying else "separating",
-                    "timing": str(timing_estimate),
-                    "days_to_perfect": float(timing_days) if aspect.applying else 0.0
-                })
-        
-        # Sort by timing for applying aspects, orb for separating
-        current_moon_aspects.sort(key=lambda x: x.get("days_to_perfect", 999) if x["applying"] else x["orb"])
-        
-        return current_moon_aspects
+            if aspect.planet1 is Planet.MOON:
+                other_planet = aspect.planet2
+            elif aspect.planet2 is Planet.MOON:
+                other_planet = aspect.planet1
+            else:
+                continue
+            
+            orb = float(aspect.orb)
+            # Enhanced timing using real Moon speed
+            if aspect.applying:
+                timing_days = float(aspect.degrees_to_exact / moon_speed) if moon_speed > 0 else 0.0
+                timing_estimate = self._format_timing_description_enhanced(timing_days)
+                sort_key = timing_days
+            else:
+                timing_estimate = "Past"
+                timing_days = 0.0
+                sort_key = orb
+            
+            keyed_aspects.append((sort_key, {
+                "planet": other_planet.value,
+                "aspect": aspect.aspect.display_name,
+                "orb": orb,
+                "applying": bool(aspect.applying),
+                "status": "applying" if aspect.applying else "separating",
+                "timing": timing_estimate,
+                "days_to_perfect": timing_days
+            }))
+        
+        keyed_aspects.sort(key=itemgetter(0))
+        return [entry for _, entry in keyed_aspects]
     
     def _format_timing_description_enhanced(self, days: float) -> str:
         """Enhanced timing description with configuration"""
-        if days < 0.5:
-            return "Within hours"
-        elif days < 1:
-            return "Within a day"
-        elif days < 7:
-            return f"Within {int(days)} days"
-        elif days < 30:
-            return f"Within {int(days/7)} weeks"
-        elif days < 365:
-            return f"Within {int(days/30)} months"
-        else:
-            return "More than a year"
+        return format_timing_description(days)
     
     def _calculate_enhanced_timing(self, chart: HoraryChart, perfection: Dict) -> str:
         """Enhanced timing calculation with real Moon speed"""
@@ -1089,21 +1352,22 @@ class EnhancedTraditionalHoraryJudgmentEngine:
     
     def _find_applying_aspect(self, chart: HoraryChart, planet1: Planet, planet2: Planet) -> Optional[Dict]:
         """Find applying aspect between two planets (preserved)"""
-        for aspect in chart.aspects:
-            if ((aspect.planet1 == planet1 and aspect.planet2 == planet2) or
-                (aspect.planet1 == planet2 and aspect.planet2 == planet1)) and aspect.applying:
-                return {
-                    "aspect": aspect.aspect,
-                    "orb": aspect.orb,
-                    "degrees_to_exact": aspect.degrees_to_exact
-                }
-        return None
+        aspect = chart.applying_aspect(planet1, planet2)
+        if aspect is None:
+            return None
+        return {
+            "aspect": aspect.aspect,
+            "orb": aspect.orb,
+            "degrees_to_exact": aspect.degrees_to_exact
+        }
     
     def _check_enhanced_perfection(self, chart: HoraryChart, querent: Planet, quesited: Planet,
-                                 exaltation_confidence_boost: float = 15.0) -> Dict[str, Any]:
+                                 exaltation_confidence_boost: float = 15.0, config=None) -> Dict[str, Any]:
         """Enhanced perfection check with configuration"""
         
-        config = cfg()
+        if config is None:
+            config = cfg()
+        perfection_conf = config.confidence.perfection
         querent_pos = chart.planets[querent]
         quesited_pos = chart.planets[quesited]
         
@@ -1121,13 +1385,13 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                         "perfects": True,
                         "type": "direct",
                         "favorable": True,
-                        "confidence": config.confidence.perfection.direct_with_mutual_rulership,
+                        "confidence": perfection_conf.direct_with_mutual_rulership,
                         "reason": f"{direct_aspect['aspect'].display_name} with mutual rulership - unconditional perfection",
                         "reception": reception,
                         "aspect": direct_aspect
                     }
                 elif reception == "mutual_exaltation":
-                    base_confidence = config.confidence.perfection.direct_with_mutual_exaltation
+                    base_confidence = perfection_conf.direct_with_mutual_exaltation
                     boosted_confidence = min(100, base_confidence + exaltation_confidence_boost)
                     
                     return {
@@ -1145,7 +1409,7 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                         "perfects": True,
                         "type": "direct",
                         "favorable": favorable,
-                        "confidence": config.confidence.perfection.direct_basic,
+                        "confidence": perfection_conf.direct_basic,
                         "reason": f"{direct_aspect['aspect'].display_name} between significators" + 
                                  (f" with {reception}" if reception != "none" else ""),
                         "reception": reception,
@@ -1153,25 +1417,25 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                     }
         
         # 2. Enhanced translation of light
-        translation = self._check_enhanced_translation_of_light(chart, querent, quesited)
+        translation = self._check_enhanced_translation_of_light(chart, querent, quesited, config)
         if translation["found"]:
             return {
                 "perfects": True,
                 "type": "translation",
                 "favorable": translation["favorable"],
-                "confidence": config.confidence.perfection.translation_of_light,
+                "confidence": perfection_conf.translation_of_light,
                 "reason": f"Translation of light by {translation['translator'].value} - {translation['sequence']}",
                 "translator": translation["translator"]
             }
         
         # 3. Enhanced collection of light
-        collection = self._check_enhanced_collection_of_light(chart, querent, quesited)
+        collection = self._check_enhanced_collection_of_light(chart, querent, quesited, config)
         if collection["found"]:
             return {
                 "perfects": True,
                 "type": "collection",
                 "favorable": collection["favorable"],
-                "confidence": config.confidence.perfection.collection_of_light,
+                "confidence": perfection_conf.collection_of_light,
                 "reason": f"Collection of light by {collection['collector'].value}",
                 "collector": collection["collector"]
             }
@@ -1183,12 +1447,12 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                 "perfects": True,
                 "type": "reception",
                 "favorable": True,
-                "confidence": config.confidence.perfection.reception_only,
+                "confidence": perfection_conf.reception_only,
                 "reason": "Mutual reception by rulership - unconditional perfection",
                 "reception": reception
             }
         elif reception == "mutual_exaltation":
-            boosted_confidence = min(100, config.confidence.perfection.reception_only + exaltation_confidence_boost)
+            boosted_confidence = min(100, perfection_conf.reception_only + exaltation_confidence_boost)
             return {
                 "perfects": True,
                 "type": "reception",
@@ -1203,19 +1467,28 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             "reason": "No perfection found between significators"
         }
     
-    def _check_enhanced_collection_of_light(self, chart: HoraryChart, querent: Planet, quesited: Planet) -> Dict[str, Any]:
+    def _check_enhanced_collection_of_light(self, chart: HoraryChart, querent: Planet, quesited: Planet,
+                                            config=None) -> Dict[str, Any]:
         """Enhanced collection with configuration"""
         
-        config = cfg()
+        if config is None:
+            config = cfg()
         collection_config = config.moon.collection
         
+        # The significators' sign exits do not depend on the candidate collector
+        skip = {querent, quesited}
+        querent_pos = chart.planets[querent]
+        quesited_pos = chart.planets[quesited]
+        querent_days_to_sign = days_to_sign_exit(querent_pos.longitude, querent_pos.speed)
+        quesited_days_to_sign = days_to_sign_exit(quesited_pos.longitude, quesited_pos.speed)
+        
         for planet, pos in chart.planets.items():
-            if planet in [querent, quesited]:
+            if planet in skip:
                 continue
             
             # Check if this planet receives aspects from both significators
-            aspects_from_querent = self._find_applying_aspect(chart, querent, planet)
-            aspects_from_quesited = self._find_applying_aspect(chart, quesited, planet)
+            aspects_from_querent = chart.applying_aspect(querent, planet)
+            aspects_from_quesited = chart.applying_aspect(quesited, planet)
             
             if aspects_from_querent and aspects_from_quesited:
                 # Check dignity requirement if configured
@@ -1223,17 +1496,12 @@ class EnhancedTraditionalHoraryJudgmentEngine:
                     if pos.dignity_score < collection_config.minimum_dignity_score:
                         continue
                 
-                # Enhanced timing enforcement
-                querent_pos = chart.planets[querent]
-                quesited_pos = chart.planets[quesited]
-                
-                querent_days_to_sign = days_to_sign_exit(querent_pos.longitude, querent_pos.speed)
-                quesited_days_to_sign = days_to_sign_exit(quesited_pos.longitude, quesited_pos.speed)
-                
-                # Calculate days to perfect both collection aspects
+                # Calculate days to perfect both collection aspects (0 when the pair moves together)
+                querent_relative = abs(querent_pos.speed - pos.speed)
+                quesited_relative = abs(quesited_pos.speed - pos.speed)
                 max_collection_days = max(
-                    aspects_from_querent["degrees_to_exact"] / abs(querent_pos.speed - pos.speed) if abs(querent_pos.speed - pos.speed) > 0 else 0,
-                    aspects_from_quesited["degrees_to_exact"] / abs(quesited_pos.speed - pos.speed) if abs(quesited_pos.speed - pos.speed) > 0 else 0
+                    aspects_from_querent.degrees_to_exact / querent_relative if querent_relative else 0,
+                    aspects_from_quesited.degrees_to_exact / quesited_relative if quesited_relative else 0
                 )
                 
                 # Check if collection completes before sign changes
@@ -1280,6 +1548,14 @@ class EnhancedTraditionalHoraryJudgmentEngine:
     def _check_enhanced_mutual_reception(self, chart: HoraryChart, planet1: Planet, planet2: Planet) -> str:
         """Enhanced mutual reception check (preserved logic)"""
         
+        # Reception is symmetric in the two planets, so one entry serves both orders
+        key = frozenset((planet1, planet2))
+        reception = chart.reception_cache.get(key)
+        if reception is None:
+            reception = chart.reception_cache[key] = self._mutual_reception(chart, planet1, planet2)
+        return reception
+    
+    def _mutual_reception(self, chart: HoraryChart, planet1: Planet, planet2: Planet) -> str:
         pos1 = chart.planets[planet1]
         pos2 = chart.planets[planet2]
         
@@ -1288,14 +1564,13 @@ class EnhancedTraditionalHoraryJudgmentEngine:
             return "mutual_rulership"
         
         # Mutual reception by exaltation
-        calc = self.calculator
-        if (planet1 in calc.exaltations and calc.exaltations[planet1] == pos2.sign and
-            planet2 in calc.exaltations and calc.exaltations[planet2] == pos1.sign):
+        exalted = self.calculator.exaltation_pairs
+        if (planet1, pos2.sign) in exalted and (planet2, pos1.sign) in exalted:
             return "mutual_exaltation"
         
         # Mixed reception
-        if ((pos1.sign.ruler == planet2 and planet2 in calc.exaltations and calc.exaltations[planet2] == pos1.sign) or
-            (pos2.sign.ruler == planet1 and planet1 in calc.exaltations and calc.exaltations[planet1] == pos2.sign)):
+        if ((pos1.sign.ruler == planet2 and (planet2, pos1.sign) in exalted) or
+            (pos2.sign.ruler == planet1 and (planet1, pos2.sign) in exalted)):
             return "mixed_reception"
         
         return "none"
@@ -1303,16 +1578,8 @@ class EnhancedTraditionalHoraryJudgmentEngine:
     def _is_aspect_favorable(self, aspect: Aspect, reception: str) -> bool:
         """Determine if aspect is favorable (preserved)"""
         
-        favorable_aspects = [Aspect.CONJUNCTION, Aspect.SEXTILE, Aspect.TRINE]
-        unfavorable_aspects = [Aspect.SQUARE, Aspect.OPPOSITION]
-        
-        base_favorable = aspect in favorable_aspects
-        
         # Mutual reception can overcome bad aspects
-        if reception in ["mutual_rulership", "mutual_exaltation", "mixed_reception"]:
-            return True
-        
-        return base_favorable
+        return reception in _FAVORABLE_RECEPTIONS or aspect in _FAVORABLE_ASPECTS
     
     def _analyze_enhanced_solar_factors(self, chart: HoraryChart, querent: Planet, quesited: Planet, 
                                       ignore_combustion: bool = False) -> Dict:
@@ -1321,26 +1588,21 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         solar_analyses = getattr(chart, 'solar_analyses', {})
         
         # Count significant solar conditions
-        cazimi_planets = []
-        combusted_planets = []
-        under_beams_planets = []
-        
+        buckets = ([], [], [])
         for planet, analysis in solar_analyses.items():
-            if analysis.condition == SolarCondition.CAZIMI:
-                cazimi_planets.append(planet)
-            elif analysis.condition == SolarCondition.COMBUSTION and not ignore_combustion:
-                combusted_planets.append(planet)
-            elif analysis.condition == SolarCondition.UNDER_BEAMS and not ignore_combustion:
-                under_beams_planets.append(planet)
+            bucket = _SOLAR_BUCKETS.get(analysis.condition)
+            if bucket is not None and (bucket == 0 or not ignore_combustion):
+                buckets[bucket].append(planet)
+        cazimi_planets, combusted_planets, under_beams_planets = buckets
         
         # Build summary with override notes
         summary_parts = []
         if cazimi_planets:
-            summary_parts.append(f"Cazimi: {', '.join(p.value for p in cazimi_planets)}")
+            summary_parts.append(f"Cazimi: {', '.join(_PLANET_NAMES[p] for p in cazimi_planets)}")
         if combusted_planets:
-            summary_parts.append(f"Combusted: {', '.join(p.value for p in combusted_planets)}")
+            summary_parts.append(f"Combusted: {', '.join(_PLANET_NAMES[p] for p in combusted_planets)}")
         if under_beams_planets:
-            summary_parts.append(f"Under Beams: {', '.join(p.value for p in under_beams_planets)}")
+            summary_parts.append(f"Under Beams: {', '.join(_PLANET_NAMES[p] for p in under_beams_planets)}")
         
         if ignore_combustion and (combusted_planets or under_beams_planets):
             summary_parts.append("(Combustion effects ignored by override)")
@@ -1348,15 +1610,19 @@ class EnhancedTraditionalHoraryJudgmentEngine:
         # Convert detailed analyses for JSON serialization
         detailed_analyses_serializable = {}
         for planet, analysis in solar_analyses.items():
-            detailed_analyses_serializable[planet.value] = {
-                "planet": planet.value,
+            condition = analysis.condition
+            effect_ignored = ignore_combustion and condition in _COMBUSTION_CONDITIONS
+            condition_name, dignity_modifier, description = _CONDITION_FIELDS[condition]
+            name = _PLANET_NAMES[planet]
+            detailed_analyses_serializable[name] = {
+                "planet": name,
                 "distance_from_sun": round(analysis.distance_from_sun, 4),
-                "condition": analysis.condition.condition_name,
-                "dignity_modifier": analysis.condition.dignity_modifier if not (ignore_combustion and analysis.condition in [SolarCondition.COMBUSTION, SolarCondition.UNDER_BEAMS]) else 0,
-                "description": analysis.condition.description,
+                "condition": condition_name,
+                "dignity_modifier": 0 if effect_ignored else dignity_modifier,
+                "description": description,
                 "exact_cazimi": bool(analysis.exact_cazimi),
                 "traditional_exception": bool(analysis.traditional_exception),
-                "effect_ignored": ignore_combustion and analysis.condition in [SolarCondition.COMBUSTION, SolarCondition.UNDER_BEAMS]
+                "effect_ignored": effect_ignored
             }
         
         return {
@@ -1513,13 +1779,31 @@ class HoraryConfigurationError(Exception):
 
 
 # Logging setup for the module
+_LOG_LEVELS = {
+    "CRITICAL": logging.CRITICAL,
+    "FATAL": logging.CRITICAL,
+    "ERROR": logging.ERROR,
+    "WARNING": logging.WARNING,
+    "WARN": logging.WARNING,
+    "INFO": logging.INFO,
+    "DEBUG": logging.DEBUG,
+    "NOTSET": logging.NOTSET,
+}
+
+# (level, log_file) the engine logger was last configured with
+_logging_setup: Optional[Tuple[int, Optional[str]]] = None
+
+
 def setup_horary_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
-    """Setup logging for horary engine"""
-    import logging
+    """Setup logging for horary engine (no-op if already set up the same way)"""
+    global _logging_setup
+    
+    setup = (_LOG_LEVELS.get(level.upper(), logging.INFO), log_file)
+    if setup == _logging_setup and logger.handlers:
+        return
     
     # Configure logger
-    logger = logging.getLogger(__name__)
-    logger.setLevel(getattr(logging, level.upper(), logging.INFO))
+    logger.setLevel(setup[0])
     
     # Clear existing handlers
     logger.handlers.clear()
@@ -1540,21 +1824,25 @@ def setup_horary_logging(level: str = "INFO", log_file: Optional[str] = None) ->
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
     
+    _logging_setup = setup
     logger.info(f"Horary engine logging configured at {level} level")
 
 
 # Performance monitoring helpers
 def profile_calculation(func):
-    """Decorator to profile calculation performance"""
+    """Decorator to profile calculation performance (only when HORARY_PROFILE=true)"""
     import time
-    import functools
+    
+    # Profiling is opt-in: otherwise the function is returned unwrapped
+    if os.environ.get('HORARY_PROFILE') != 'true':
+        return func
     
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter()
         try:
             result = func(*args, **kwargs)
-            end_time = time.time()
+            end_time = time.perf_counter()
             execution_time = end_time - start_time
             
             logger.info(f"{func.__name__} executed in {execution_time:.4f} seconds")
@@ -1568,7 +1856,7 @@ def profile_calculation(func):
             
             return result
         except Exception as e:
-            end_time = time.time()
+            end_time = time.perf_counter()
             execution_time = end_time - start_time
             logger.error(f"{func.__name__} failed after {execution_time:.4f} seconds: {e}")
             raise
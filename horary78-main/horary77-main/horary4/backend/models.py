@@ -3,12 +3,19 @@
 
 import datetime
 import logging
-from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional, Any
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, List, Tuple, Optional, Any
 from enum import Enum
 
+import numpy as np
+
 from horary_config import cfg
 
+# Slotted dataclasses (Python 3.10+) for the per-chart models: faster attribute
+# access and no per-instance __dict__
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 logger = logging.getLogger(__name__)
 
 class Planet(Enum):
@@ -69,6 +76,10 @@ class Sign(Enum):
         self.ruler = ruler
 
 
+# Signs in zodiacal order, indexed by 30° segment of longitude
+_SIGNS = tuple(Sign)
+
+
 class SolarCondition(Enum):
     """Solar conditions affecting planetary dignity"""
     CAZIMI = ("Cazimi", 6, "Heart of the Sun - maximum dignity")
@@ -92,7 +103,7 @@ class SolarAnalysis:
     traditional_exception: bool = False
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PlanetPosition:
     planet: Planet
     longitude: float
@@ -102,9 +113,51 @@ class PlanetPosition:
     dignity_score: int
     retrograde: bool = False
     speed: float = 0.0  # degrees per day
+    
+    @classmethod
+    def from_row(cls, planet: Planet, row, sign_idx: int, house: int = 0) -> 'PlanetPosition':
+        """Build from a Swiss Ephemeris result row (longitude, latitude, distance, speed, ...)"""
+        speed = float(row[3])
+        return cls(planet, float(row[0]), float(row[1]), int(house), _SIGNS[sign_idx], 0,
+                   speed < 0, speed)
 
 
 @dataclass
+class PlanetArrays:
+    """Structure-of-arrays view of a chart's planets, one entry per planet in `planets` order"""
+    planets: Tuple[Planet, ...]
+    lon: np.ndarray  # float64 longitudes
+    lat: np.ndarray  # float64 latitudes
+    speed: np.ndarray  # float64 degrees per day
+    sign_idx: np.ndarray  # int8, 0 = Aries ... 11 = Pisces
+    house_idx: np.ndarray  # int8 house numbers (1-12)
+    dignity: np.ndarray  # int16 dignity scores
+    # Pairwise separations, filled on first use by pairwise_separation()
+    separation: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    
+    @classmethod
+    def from_positions(cls, positions: Dict[Planet, PlanetPosition]) -> 'PlanetArrays':
+        """Build the arrays from PlanetPosition objects"""
+        values = list(positions.values())
+        return cls(
+            planets=tuple(positions),
+            lon=np.array([pos.longitude for pos in values], dtype=np.float64),
+            lat=np.array([pos.latitude for pos in values], dtype=np.float64),
+            speed=np.array([pos.speed for pos in values], dtype=np.float64),
+            sign_idx=np.array([pos.sign.start_degree // 30 for pos in values], dtype=np.int8),
+            house_idx=np.array([pos.house for pos in values], dtype=np.int8),
+            dignity=np.array([pos.dignity_score for pos in values], dtype=np.int16)
+        )
+    
+    def pairwise_separation(self) -> np.ndarray:
+        """(n, n) angular separations folded into 0-180, computed once and shared"""
+        if self.separation is None:
+            diff = np.abs(self.lon[:, None] - self.lon[None, :])
+            self.separation = np.minimum(diff, 360 - diff)
+        return self.separation
+
+
+@dataclass(**_SLOTS)
 class AspectInfo:
     planet1: Planet
     planet2: Planet
@@ -115,7 +168,7 @@ class AspectInfo:
     degrees_to_exact: float = 0.0
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class LunarAspect:
     """Enhanced lunar aspect information"""
     planet: Planet
@@ -136,7 +189,7 @@ class Significator:
     role: str  # "querent", "quesited", "co-significator", etc.
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class HoraryChart:
     date_time: datetime.datetime
     date_time_utc: datetime.datetime  # UTC time for calculations
@@ -154,5 +207,56 @@ class HoraryChart:
     # NEW: Enhanced lunar information
     moon_last_aspect: Optional[LunarAspect] = None
     moon_next_aspect: Optional[LunarAspect] = None
+    # Array view of `planets` for vectorized analysis
+    planet_arrays: Optional[PlanetArrays] = None
+    # Contiguous float64 copy of `houses` for the numeric kernels
+    houses_arr: Optional[np.ndarray] = field(default=None, repr=False, compare=False)
+    # (planet1, planet2) -> first applying aspect, filled on first use by applying_aspect()
+    applying_index: Optional[Dict[Tuple[Planet, Planet], AspectInfo]] = field(
+        default=None, repr=False, compare=False)
+    # {planet1, planet2} -> reception kind, filled by the judgment engine as pairs are checked
+    reception_cache: Dict[FrozenSet[Planet], str] = field(default_factory=dict, repr=False, compare=False)
+    # (config, Moon accidental bonuses) from the last judgment, reused while the config is unchanged
+    moon_accidentals_cache: Optional[Tuple[Any, Dict[str, int]]] = field(default=None, repr=False, compare=False)
+    # Direct references to planets[Planet.MOON] / planets[Planet.SUN]
+    moon: Optional[PlanetPosition] = field(default=None, repr=False, compare=False)
+    sun: Optional[PlanetPosition] = field(default=None, repr=False, compare=False)
+    # Chart-wide scalars read throughout judgment, derived once from the fields above
+    moon_sun_elongation: Optional[float] = field(default=None, repr=False, compare=False)
+    moon_deg_in_sign: Optional[float] = field(default=None, repr=False, compare=False)
+    moon_speed_abs: Optional[float] = field(default=None, repr=False, compare=False)
+    asc_deg_in_sign: Optional[float] = field(default=None, repr=False, compare=False)
+    
+    def __post_init__(self):
+        if self.planet_arrays is None:
+            self.planet_arrays = PlanetArrays.from_positions(self.planets)
+        if self.houses_arr is None:
+            self.houses_arr = np.ascontiguousarray(self.houses, dtype=np.float64)
+        if self.asc_deg_in_sign is None:
+            self.asc_deg_in_sign = self.ascendant % 30
+        if self.moon is None:
+            self.moon = self.planets.get(Planet.MOON)
+        if self.sun is None:
+            self.sun = self.planets.get(Planet.SUN)
+        moon, sun = self.moon, self.sun
+        if moon is not None:
+            if self.moon_deg_in_sign is None:
+                self.moon_deg_in_sign = moon.longitude % 30
+            if self.moon_speed_abs is None:
+                self.moon_speed_abs = abs(moon.speed)
+            if sun is not None and self.moon_sun_elongation is None:
+                diff = abs(moon.longitude - sun.longitude)
+                self.moon_sun_elongation = min(diff, 360 - diff)
+    
+    def applying_aspect(self, planet1: Planet, planet2: Planet) -> Optional[AspectInfo]:
+        """First applying aspect between two planets in either order, or None"""
+        if self.applying_index is None:
+            index = {}
+            for aspect in self.aspects:
+                if aspect.applying:
+                    index.setdefault((aspect.planet1, aspect.planet2), aspect)
+                    index.setdefault((aspect.planet2, aspect.planet1), aspect)
+            self.applying_index = index
+        return self.applying_index.get((planet1, planet2))
 
 
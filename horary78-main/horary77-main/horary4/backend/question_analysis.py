@@ -1,50 +1,123 @@
 # -*- coding: utf-8 -*-
 """Question analysis utilities for horary astrology engine."""
 
-from typing import Dict, Any, List, Optional, Set
+import functools
+import re
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+
+
+def _keyword_scanner(keyword_groups: Mapping[Any, Tuple[str, ...]]) -> "re.Pattern[str]":
+    """Compile keyword lists into one regex scanned in a single pass.
+
+    The pattern matches (zero-width) at every position where some keyword starts;
+    ``match.lastindex`` is 1 + the index of the first group, in dict order, with a
+    keyword starting there. The lowest index over all matches is therefore the first
+    group with any keyword anywhere in the text - the same answer as testing each
+    group's keywords with ``in``, in order.
+    """
+    alternatives = "|".join(f"({'|'.join(map(re.escape, keywords))})"
+                            for keywords in keyword_groups.values())
+    return re.compile(f"(?=(?:{alternatives}))")
+
+
+def _category_scanner(categories: Mapping[Any, Tuple[str, ...]]) -> Tuple["re.Pattern[str]", Dict[str, int]]:
+    """Compile keyword categories into one regex and a keyword -> category bitmask table.
+
+    Category i sets bit ``1 << i``. Keywords are tried longest first, so each match is
+    the longest keyword starting at that position; every other keyword starting there
+    is a prefix of it, so its mask also carries the bits of all its keyword prefixes.
+    OR-ing the masks of all matches gives the categories with any keyword in the text.
+    """
+    owners: Dict[str, int] = {}
+    for bit, keywords in enumerate(categories.values()):
+        for keyword in keywords:
+            owners[keyword] = owners.get(keyword, 0) | (1 << bit)
+    
+    masks = {}
+    for keyword in owners:
+        mask = 0
+        for other, bits in owners.items():
+            if keyword.startswith(other):
+                mask |= bits
+        masks[keyword] = mask
+    
+    keywords = sorted(owners, key=len, reverse=True)
+    return re.compile(f"(?=({'|'.join(map(re.escape, keywords))}))"), masks
+
+
+# Traditional house meanings for horary
+_HOUSE_MEANINGS: Mapping[int, Tuple[str, ...]] = MappingProxyType({
+    1: ("querent", "self", "body", "life", "personality", "appearance"),
+    2: ("money", "possessions", "moveable goods", "income", "resources", "values"),
+    3: ("siblings", "neighbors", "short journeys", "communication", "letters", "rumors"),
+    4: ("father", "home", "land", "property", "endings", "foundations", "graves"),
+    5: ("children", "pregnancy", "pleasure", "gambling", "creativity", "entertainment"),
+    6: ("illness", "servants", "small animals", "work", "daily routine", "uncle/aunt"),
+    7: ("spouse", "partner", "open enemies", "thieves", "others", "contracts"),
+    8: ("death", "partner's money", "wills", "transformation", "fear", "surgery"),
+    9: ("long journeys", "foreign lands", "religion", "law", "higher learning", "dreams"),
+    10: ("mother", "career", "honor", "reputation", "authority", "government"),
+    11: ("friends", "hopes", "wishes", "advisors", "king's money", "groups"),
+    12: ("hidden enemies", "large animals", "prisons", "secrets", "self-undoing", "witchcraft"),
+})
+
+# Question type patterns, in priority order
+_QUESTION_PATTERNS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "lost_object": ("where is", "lost", "missing", "find", "stolen"),
+    "marriage": ("marry", "wedding", "spouse", "husband", "wife"),
+    "pregnancy": ("pregnant", "child", "baby", "conceive"),
+    "travel": ("journey", "travel", "trip", "go to", "visit"),
+    "money": ("money", "wealth", "rich", "profit", "gain", "debt"),
+    "career": ("job", "career", "work", "employment", "business"),
+    "health": ("sick", "ill", "illness", "disease", "health", "recover", "die"),
+    "lawsuit": ("court", "lawsuit", "legal", "judge", "trial"),
+    "relationship": ("love", "relationship", "friend", "enemy"),
+})
+_QUESTION_TYPES = tuple(_QUESTION_PATTERNS)
+_QUESTION_TYPE_SCANNER = _keyword_scanner(_QUESTION_PATTERNS)
+
+# Person keywords mapped to their traditional houses, in priority order
+_PERSON_KEYWORDS: Mapping[int, Tuple[str, ...]] = MappingProxyType({
+    4: ("father", "dad", "grandfather", "stepfather"),
+    10: ("mother", "mom", "mum", "stepmother"),
+    7: ("spouse", "husband", "wife", "partner"),
+    3: ("brother", "sister", "sibling"),
+    5: ("child", "son", "daughter", "baby"),
+    11: ("friend", "ally", "benefactor"),
+})
+
+# Keyword categories _determine_houses looks for, found in one scan of the question
+_CATEGORIES: Dict[Any, Tuple[str, ...]] = {("person", house): kws for house, kws in _PERSON_KEYWORDS.items()}
+_CATEGORIES.update({
+    "death": ("die", "death", "pass away", "funeral"),
+    "illness": ("sick", "ill", "illness", "disease", "recover"),
+    "far": ("far", "foreign", "abroad"),
+    "spouse": ("spouse",),
+    "child": ("child",),
+})
+_CATEGORIES.update({("house", house): kws for house, kws in _HOUSE_MEANINGS.items()})
+_CATEGORY_BITS: Mapping[Any, int] = MappingProxyType(
+    {category: 1 << bit for bit, category in enumerate(_CATEGORIES)})
+_CATEGORY_SCANNER, _KEYWORD_MASKS = _category_scanner(_CATEGORIES)
+
 
 class TraditionalHoraryQuestionAnalyzer:
     """Analyze questions using traditional horary house assignments"""
     
     def __init__(self):
-        # Traditional house meanings for horary
-        self.house_meanings = {
-            1: ["querent", "self", "body", "life", "personality", "appearance"],
-            2: ["money", "possessions", "moveable goods", "income", "resources", "values"],
-            3: ["siblings", "neighbors", "short journeys", "communication", "letters", "rumors"],
-            4: ["father", "home", "land", "property", "endings", "foundations", "graves"],
-            5: ["children", "pregnancy", "pleasure", "gambling", "creativity", "entertainment"],
-            6: ["illness", "servants", "small animals", "work", "daily routine", "uncle/aunt"],
-            7: ["spouse", "partner", "open enemies", "thieves", "others", "contracts"],
-            8: ["death", "partner's money", "wills", "transformation", "fear", "surgery"],
-            9: ["long journeys", "foreign lands", "religion", "law", "higher learning", "dreams"],
-            10: ["mother", "career", "honor", "reputation", "authority", "government"],
-            11: ["friends", "hopes", "wishes", "advisors", "king's money", "groups"],
-            12: ["hidden enemies", "large animals", "prisons", "secrets", "self-undoing", "witchcraft"]
-        }
-        
-        # Question type patterns
-        self.question_patterns = {
-            "lost_object": ["where is", "lost", "missing", "find", "stolen"],
-            "marriage": ["marry", "wedding", "spouse", "husband", "wife"],
-            "pregnancy": ["pregnant", "child", "baby", "conceive"],
-            "travel": ["journey", "travel", "trip", "go to", "visit"],
-            "money": ["money", "wealth", "rich", "profit", "gain", "debt"],
-            "career": ["job", "career", "work", "employment", "business"],
-            "health": ["sick", "ill", "illness", "disease", "health", "recover", "die"],
-            "lawsuit": ["court", "lawsuit", "legal", "judge", "trial"],
-            "relationship": ["love", "relationship", "friend", "enemy"]
-        }
+        # Keyword tables and their compiled scanners are shared by all analyzers
+        self.house_meanings = _HOUSE_MEANINGS
+        self.question_patterns = _QUESTION_PATTERNS
+        self.person_keywords = _PERSON_KEYWORDS
+        self._question_types = _QUESTION_TYPES
+        self._question_type_scanner = _QUESTION_TYPE_SCANNER
+        self._category_bits = _CATEGORY_BITS
+        self._category_scanner = _CATEGORY_SCANNER
+        self._keyword_masks = _KEYWORD_MASKS
         
-        # Person keywords mapped to their traditional houses
-        self.person_keywords = {
-            4: ["father", "dad", "grandfather", "stepfather"],
-            10: ["mother", "mom", "mum", "stepmother"],
-            7: ["spouse", "husband", "wife", "partner"],
-            3: ["brother", "sister", "sibling"],
-            5: ["child", "son", "daughter", "baby"],
-            11: ["friend", "ally", "benefactor"]
-        }
+        # Analysis depends only on the lowercased question, so repeats are served from here
+        self._analyze_cached = functools.lru_cache(maxsize=512)(self._analyze)
     
     def _turn(self, base: int, offset: int) -> int:
         """Return the house offset steps from base (1-based)."""
@@ -53,13 +126,18 @@ class TraditionalHoraryQuestionAnalyzer:
     def analyze_question(self, question: str) -> Dict[str, Any]:
         """Analyze question to determine significators using traditional methods"""
         
-        question_lower = question.lower()
-        
+        cached = self._analyze_cached(question.lower().strip())
+        # Fresh containers each call: callers adjust the significators in place
+        significators = dict(cached["significators"])
+        significators["special_significators"] = dict(significators["special_significators"])
+        return {**cached, "relevant_houses": list(cached["relevant_houses"]), "significators": significators}
+    
+    def _analyze(self, question_lower: str) -> Dict[str, Any]:
         # Determine question type
         question_type = self._determine_question_type(question_lower)
         
         # Determine primary houses involved
-        houses = self._determine_houses(question, question_type)
+        houses = self._determine_houses(question_lower, question_type)
         
         # Determine significators
         significators = self._determine_significators(houses, question_type)
@@ -73,33 +151,40 @@ class TraditionalHoraryQuestionAnalyzer:
     
     def _determine_question_type(self, question: str) -> str:
         """Determine the type of horary question"""
-        for q_type, keywords in self.question_patterns.items():
-            if any(keyword in question for keyword in keywords):
-                return q_type
-        return "general"
+        best = None
+        for match in self._question_type_scanner.finditer(question):
+            if best is None or match.lastindex < best:
+                best = match.lastindex
+                if best == 1:  # Highest-priority type, nothing can beat it
+                    break
+        return self._question_types[best - 1] if best is not None else "general"
     
-    def _determine_houses(self, question: str, question_type: str) -> List[int]:
-        """Determine which houses are involved in the question"""
-        from typing import List, Set, Optional
-        question_lower = question.lower()
-        houses: List[int] = [1]  # 1st house = querent
+    def _category_mask(self, question_lower: str) -> int:
+        """Bitmask of the keyword categories with a keyword anywhere in the question"""
+        mask = 0
+        for match in self._category_scanner.finditer(question_lower):
+            mask |= self._keyword_masks[match.group(1)]
+        return mask
+    
+    def _determine_houses(self, question_lower: str, question_type: str) -> List[int]:
+        """Determine which houses are involved in the (lowercased) question"""
+        houses: List[int] = [1]  # 1st house = querent
+        mask = self._category_mask(question_lower)
+        bits = self._category_bits
         
         # ------------- detect named person -------------
-        subject_house: Optional[int] = None
-        for h, kws in self.person_keywords.items():
-            if any(k in question_lower for k in kws):
-                subject_house = h
-                break
+        subject_house: Optional[int] = None
+        for h in self.person_keywords:
+            if mask & bits[("person", h)]:
+                subject_house = h
+                break
         
         # ------------- detect key themes ---------------
-        death_words = ["die", "death", "pass away", "funeral"]
-        illness_words = ["sick", "ill", "illness", "disease", "recover"]
-        
-        if subject_house is not None:
-            if any(w in question_lower for w in death_words):
+        if subject_house is not None:
+            if mask & bits["death"]:
                 houses.append(self._turn(subject_house, 8))  # 8th from subject
                 houses.append(subject_house)
-            elif any(w in question_lower for w in illness_words):
+            elif mask & bits["illness"]:
                 # Illness of a known person: 6th house of illness and the person's house
                 houses.append(6)
                 houses.append(subject_house)
@@ -109,12 +194,12 @@ class TraditionalHoraryQuestionAnalyzer:
             # ✱ Unchanged fallback branch ✱
             if question_type == "lost_object":
                 houses.append(2)  # Moveable possessions
-            elif question_type == "marriage" or "spouse" in question_lower:
+            elif question_type == "marriage" or mask & bits["spouse"]:
                 houses.append(7)  # Marriage/spouse
-            elif question_type == "pregnancy" or "child" in question_lower:
+            elif question_type == "pregnancy" or mask & bits["child"]:
                 houses.append(5)  # Children
             elif question_type == "travel":
-                if any(word in question_lower for word in ["far", "foreign", "abroad"]):
+                if mask & bits["far"]:
                     houses.append(9)  # Long journeys
                 else:
                     houses.append(3)  # Short journeys
@@ -131,13 +216,12 @@ class TraditionalHoraryQuestionAnalyzer:
                 houses.append(7)
 
             # Look for specific house keywords
-            for house, keywords in self.house_meanings.items():
-                if house not in houses and any(keyword in question_lower for keyword in keywords):
+            for house in self.house_meanings:
+                if house not in houses and mask & bits[("house", house)]:
                     houses.append(house)
         
         # ------------- de-duplicate while preserving order -------------
-        seen: Set[int] = set()
-        return [h for h in houses if not (h in seen or seen.add(h))]
+        return list(dict.fromkeys(houses))
     
     def _determine_significators(self, houses: List[int], question_type: str) -> Dict[str, Any]:
         """Determine traditional significators"""
@@ -1,5 +1,6 @@
 import os
 import sys
+from types import SimpleNamespace
 from unittest.mock import patch
 
 
@@ -65,3 +66,175 @@ def test_calculate_chart(client):
     assert len(data["chart_data"]["houses"]) == 12
     assert data["chart_data"]["planets"]
     assert data["moon_aspects"]
+
+
+def test_geocode_cached_on_normalized_location():
+    calls = []
+
+    def counting_geocode(location_string: str, timeout: int = 10):
+        calls.append(location_string)
+        return stub_geocode(location_string, timeout)
+
+    judgment_engine._GEOCODE_CACHE.clear()
+    with patch.object(judgment_engine, "safe_geocode", counting_geocode), \
+         patch.object(judgment_engine.TimezoneManager, "get_timezone_for_location", stub_get_timezone):
+        engine = judgment_engine.EnhancedTraditionalHoraryJudgmentEngine()
+        for location in ("London,  UK", "london, uk"):
+            result = engine.judge_question("Will I win?", location, "2025-01-15", "10:30",
+                                           use_current_time=False)
+            assert "error" not in result
+    judgment_engine._GEOCODE_CACHE.clear()
+
+    # The location is sent as typed; only the cache key is normalized
+    assert calls == ["London,  UK"]
+
+
+def test_judge_many_geocodes_each_location_once():
+    calls = []
+    sleeps = []
+
+    def counting_geocode(location_string: str, timeout: int = 10):
+        calls.append(location_string)
+        if location_string == "Atlantis":
+            raise judgment_engine.LocationError(f"Location not found: '{location_string}'")
+        return stub_geocode(location_string, timeout)
+
+    question = {"question": "Will I win?", "date_str": "2025-01-15", "time_str": "10:30",
+                "use_current_time": False}
+    judgment_engine._GEOCODE_CACHE.clear()
+    with patch.object(judgment_engine, "safe_geocode", counting_geocode), \
+         patch.object(judgment_engine.time, "sleep", sleeps.append), \
+         patch.object(judgment_engine.TimezoneManager, "get_timezone_for_location", stub_get_timezone):
+        engine = judgment_engine.EnhancedTraditionalHoraryJudgmentEngine()
+        results = engine.judge_many([dict(question, location=loc)
+                                     for loc in ("London, UK", "Atlantis", "london, uk")])
+    judgment_engine._GEOCODE_CACHE.clear()
+
+    assert calls == ["London, UK", "Atlantis"]
+    # Two lookups, one rate-limit pause between them
+    assert len(sleeps) == 1 and 0 < sleeps[0] <= judgment_engine.NOMINATIM_MIN_DELAY_SECONDS
+    assert [r["judgment"] == "LOCATION_ERROR" for r in results] == [False, True, False]
+    assert "'Atlantis'" in results[1]["error"]
+    assert results[0]["judgment"] == results[2]["judgment"]
+
+
+def test_judge_variants_matches_individual_judgments():
+    import datetime
+    import numpy as np
+
+    engine = judgment_engine.EnhancedTraditionalHoraryJudgmentEngine()
+    dt = datetime.datetime(2021, 6, 1, 12, tzinfo=datetime.timezone.utc)
+    chart = engine.calculator.calculate_chart(dt, dt, "UTC", 51.5, -0.1, "London, UK")
+    analysis = engine.question_analyzer.analyze_question("Will I win the lawsuit?")
+    flag_matrix = np.array([[0, 0, 0, 0], [1, 1, 1, 1], [0, 0, 0, 0], [0, 1, 0, 1]], dtype=bool)
+
+    variants = engine.judge_variants(chart, analysis, flag_matrix, exaltation_confidence_boost=15.0)
+
+    assert variants.shape == (4,)
+    assert variants[0] is variants[2]
+    for flags, judgment in zip(flag_matrix.tolist(), variants):
+        assert judgment == engine._apply_enhanced_judgment(chart, analysis, *flags, 15.0)
+
+
+def test_resolved_location_skips_geocoding_and_timezone_lookup():
+    def no_network(*args, **kwargs):
+        raise AssertionError("lookup should be skipped")
+
+    with patch.object(judgment_engine, "safe_geocode", no_network), \
+         patch.object(judgment_engine.TimezoneManager, "get_timezone_for_location", no_network):
+        engine = judgment_engine.EnhancedTraditionalHoraryJudgmentEngine()
+        result = engine.judge_question("Will I win?", "London", use_current_time=True,
+                                       resolved_location=(51.5, -0.1, "Europe/London", "London, UK"))
+
+    assert "error" not in result
+    assert result["timezone_info"]["timezone"] == "Europe/London"
+    assert result["timezone_info"]["location_name"] == "London, UK"
+
+
+def test_moon_accidentals_many_matches_per_chart_helpers():
+    import datetime
+
+    engine = judgment_engine.EnhancedTraditionalHoraryJudgmentEngine()
+    start = datetime.datetime(2021, 6, 1, tzinfo=datetime.timezone.utc)
+    charts = [engine.calculator.calculate_chart(dt, dt, "UTC", 51.5, -0.1, "London, UK")
+              for dt in (start + datetime.timedelta(days=3 * i, hours=5 * i) for i in range(10))]
+
+    batched = engine.moon_accidentals_many(charts)
+
+    for i, chart in enumerate(charts):
+        assert {key: values[i] for key, values in batched.items()} == engine._moon_accidentals(chart)
+
+
+def test_mutual_reception_is_cached_per_chart_pair():
+    import datetime
+
+    engine = judgment_engine.EnhancedTraditionalHoraryJudgmentEngine()
+    dt = datetime.datetime(2021, 6, 1, tzinfo=datetime.timezone.utc)
+    chart = engine.calculator.calculate_chart(dt, dt, "UTC", 51.5, -0.1, "London, UK")
+    Planet = judgment_engine.Planet
+
+    reception = engine._check_enhanced_mutual_reception(chart, Planet.MARS, Planet.VENUS)
+
+    assert reception == engine._mutual_reception(chart, Planet.VENUS, Planet.MARS)
+    assert chart.reception_cache == {frozenset((Planet.MARS, Planet.VENUS)): reception}
+    assert engine._check_enhanced_mutual_reception(chart, Planet.VENUS, Planet.MARS) == reception
+    assert len(chart.reception_cache) == 1
+
+
+def test_moon_void_many_matches_per_chart_method():
+    import datetime
+
+    engine = judgment_engine.EnhancedTraditionalHoraryJudgmentEngine()
+    start = datetime.datetime(2021, 6, 1, tzinfo=datetime.timezone.utc)
+    times = [start + datetime.timedelta(hours=7 * i) for i in range(60)]
+    charts = [engine.calculator.calculate_chart(dt, dt, "UTC", 51.5, -0.1, "London, UK") for dt in times]
+
+    flags = engine.moon_void_many([chart.julian_day for chart in charts])
+
+    assert flags.tolist() == [engine._void_by_sign_method(chart)["void"] for chart in charts]
+    assert flags.any() and not flags.all()
+
+
+def test_json_provider_matches_stdlib_encoding():
+    import datetime
+    import json
+
+    from flask.json.provider import DefaultJSONProvider
+
+    payload = {"b": [1, 2.5, None, True], "a": {"x": "é"}, "houses": {3: "int key"},
+               "when": datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.timezone.utc)}
+    stdlib = DefaultJSONProvider(app.app)
+
+    assert json.loads(app.app.json.dumps(payload)) == json.loads(stdlib.dumps(payload))
+    with app.app.test_request_context():
+        response = app.app.json.response(payload)
+    assert response.mimetype == "application/json"
+    assert response.get_json() == json.loads(stdlib.dumps(payload))
+
+
+def test_profile_calculation_is_opt_in(monkeypatch):
+    def calculate():
+        return {"result": 1}
+
+    monkeypatch.delenv("HORARY_PROFILE", raising=False)
+    assert judgment_engine.profile_calculation(calculate) is calculate
+
+    monkeypatch.setenv("HORARY_PROFILE", "true")
+    result = judgment_engine.profile_calculation(calculate)()
+    assert result["_performance"]["function"] == "calculate"
+    assert result["_performance"]["execution_time_seconds"] >= 0
+
+
+def test_default_exaltation_boost_follows_config_reload(monkeypatch):
+    engine = judgment_engine.HoraryEngine()
+    seen = []
+    monkeypatch.setattr(engine.engine, 'judge_question', lambda **kwargs: seen.append(kwargs))
+
+    engine.judge("Will I get the job?", {})
+    default = judgment_engine.cfg().confidence.reception.mutual_exaltation_bonus
+    reloaded = SimpleNamespace(confidence=SimpleNamespace(
+        reception=SimpleNamespace(mutual_exaltation_bonus=default + 89)))
+    monkeypatch.setattr(judgment_engine, 'cfg', lambda: reloaded)
+    engine.judge("Will I get the job?", {})
+
+    assert [kwargs["exaltation_confidence_boost"] for kwargs in seen] == [default, default + 89]
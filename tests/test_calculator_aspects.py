@@ -0,0 +1,153 @@
+import datetime
+import sys
+from pathlib import Path
+
+# Ensure backend package is importable
+BACKEND_DIR = Path(__file__).resolve().parents[1] / 'horary78-main' / 'horary77-main' / 'horary4' / 'backend'
+sys.path.append(str(BACKEND_DIR))
+
+from _horary_math import format_timing_description
+from calculator import EnhancedTraditionalAstrologicalCalculator
+from judgment_engine import EnhancedTraditionalHoraryJudgmentEngine
+from models import Planet, Aspect, AspectInfo, HoraryChart, Sign, PlanetPosition
+
+JD = 2451545.0
+
+
+def _make_pos(planet, lon, speed=1.0):
+    return PlanetPosition(planet=planet, longitude=lon, latitude=0.0, house=1,
+                          sign=Sign.ARIES, dignity_score=0, speed=speed)
+
+
+def _aspect_map(aspects):
+    return {(a.planet1, a.planet2): a for a in aspects}
+
+
+def test_aspects_found_across_zero_aries():
+    calc = EnhancedTraditionalAstrologicalCalculator()
+    planets = {
+        Planet.SUN: _make_pos(Planet.SUN, 355.0),
+        Planet.MOON: _make_pos(Planet.MOON, 3.0, speed=13.0),
+        Planet.MARS: _make_pos(Planet.MARS, 178.0, speed=0.5),
+    }
+    found = _aspect_map(calc._calculate_enhanced_aspects(planets, JD))
+
+    assert found[(Planet.SUN, Planet.MOON)].aspect == Aspect.CONJUNCTION
+    assert abs(found[(Planet.SUN, Planet.MOON)].orb - 8.0) < 1e-9
+    assert found[(Planet.SUN, Planet.MARS)].aspect == Aspect.OPPOSITION
+    assert found[(Planet.MOON, Planet.MARS)].aspect == Aspect.OPPOSITION
+
+
+def test_luminary_bonus_only_widens_luminary_pairs():
+    calc = EnhancedTraditionalAstrologicalCalculator()
+    # 9.5° conjunctions: beyond the base 8° orb but inside 8° + Sun + Moon bonuses
+    planets = {
+        Planet.SUN: _make_pos(Planet.SUN, 100.0),
+        Planet.MOON: _make_pos(Planet.MOON, 109.5, speed=13.0),
+        Planet.MARS: _make_pos(Planet.MARS, 200.0),
+        Planet.SATURN: _make_pos(Planet.SATURN, 209.5, speed=0.1),
+    }
+    found = _aspect_map(calc._calculate_enhanced_aspects(planets, JD))
+
+    assert (Planet.SUN, Planet.MOON) in found
+    assert (Planet.MARS, Planet.SATURN) not in found
+
+
+def test_applying_requires_perfection_before_sign_exit():
+    calc = EnhancedTraditionalAstrologicalCalculator()
+    venus = _make_pos(Planet.VENUS, 10.0, speed=1.2)
+
+    assert calc._is_applying_enhanced(_make_pos(Planet.MOON, 65.0, speed=13.0), venus,
+                                      Aspect.SEXTILE, JD)
+    assert not calc._is_applying_enhanced(_make_pos(Planet.MOON, 75.0, speed=13.0), venus,
+                                          Aspect.SEXTILE, JD)
+    # Moon at 27° Taurus leaves the sign before the sextile from 0° Aries perfects
+    assert not calc._is_applying_enhanced(_make_pos(Planet.MOON, 57.0, speed=13.0),
+                                          _make_pos(Planet.VENUS, 0.0, speed=1.2),
+                                          Aspect.SEXTILE, JD)
+
+
+def test_moon_aspects_near_exact_is_still_applying(monkeypatch):
+    calc = EnhancedTraditionalAstrologicalCalculator()
+    monkeypatch.setattr(calc, 'get_real_moon_speed', lambda jd_ut: 13.0)
+    planets = {
+        Planet.SUN: _make_pos(Planet.SUN, 200.0),
+        Planet.MOON: _make_pos(Planet.MOON, 99.7, speed=13.0),
+        Planet.VENUS: _make_pos(Planet.VENUS, 40.0, speed=1.2),
+        Planet.SATURN: _make_pos(Planet.SATURN, 0.0, speed=0.05),
+    }
+    last_aspect, next_aspect = calc._moon_aspects(planets, JD)
+
+    # 0.3° short of the sextile to Venus: applying, even though a 0.1-day step overshoots it
+    assert next_aspect.planet == Planet.VENUS
+    assert next_aspect.aspect == Aspect.SEXTILE
+    assert abs(next_aspect.orb - 0.3) < 1e-9
+    # Moon left the square to Saturn 9.7° ago (inside the 1.5x separating orb)
+    assert last_aspect.planet == Planet.SATURN
+    assert last_aspect.aspect == Aspect.SQUARE
+    assert not last_aspect.applying
+
+
+def test_aspect_is_matched_to_nearest_angle():
+    calc = EnhancedTraditionalAstrologicalCalculator()
+    planets = {
+        Planet.MARS: _make_pos(Planet.MARS, 10.0, speed=0.5),
+        Planet.JUPITER: _make_pos(Planet.JUPITER, 94.0, speed=0.1),
+        Planet.SATURN: _make_pos(Planet.SATURN, 85.0, speed=0.05),
+    }
+    found = _aspect_map(calc._calculate_enhanced_aspects(planets, JD))
+
+    # 84° lies between the sextile and the square; only the square is in orb
+    assert found[(Planet.MARS, Planet.JUPITER)].aspect == Aspect.SQUARE
+    assert abs(found[(Planet.MARS, Planet.JUPITER)].orb - 6.0) < 1e-9
+    # 75° is halfway between sextile and square and outside both orbs
+    assert (Planet.MARS, Planet.SATURN) not in found
+
+
+def test_degrees_to_exact_reports_exact_time():
+    calc = EnhancedTraditionalAstrologicalCalculator()
+    sun = _make_pos(Planet.SUN, 100.0, speed=1.0)
+    mars = _make_pos(Planet.MARS, 104.0, speed=0.5)
+
+    # 4° closing at 0.5°/day perfects 8 days after J2000.0 (2000-01-01 12:00 UT)
+    degrees, exact_time = calc._calculate_enhanced_degrees_to_exact(sun, mars, Aspect.CONJUNCTION, JD)
+    assert abs(degrees - 4.0) < 1e-9
+    assert exact_time == datetime.datetime(2000, 1, 9, 12)
+
+
+def test_chart_applying_aspect_lookup_is_symmetric():
+    aspects = [
+        AspectInfo(Planet.SUN, Planet.MARS, Aspect.TRINE, 2.0, applying=False),
+        AspectInfo(Planet.MARS, Planet.VENUS, Aspect.SQUARE, 3.0, applying=True, degrees_to_exact=3.0),
+    ]
+    chart = HoraryChart(date_time=None, date_time_utc=None, timezone_info='UTC', location=(0.0, 0.0),
+                        location_name='', planets={}, aspects=aspects, houses=[0.0] * 12,
+                        house_rulers={}, ascendant=0.0, midheaven=270.0)
+
+    assert chart.applying_aspect(Planet.VENUS, Planet.MARS) is aspects[1]
+    assert chart.applying_aspect(Planet.MARS, Planet.VENUS) is aspects[1]
+    # Separating aspects are not indexed
+    assert chart.applying_aspect(Planet.SUN, Planet.MARS) is None
+
+
+def test_perfects_in_sign_respects_sign_exits():
+    engine = EnhancedTraditionalHoraryJudgmentEngine()
+
+    def perfects(lon1, speed1, lon2, speed2, degrees_to_exact):
+        return engine._enhanced_perfects_in_sign(
+            _make_pos(Planet.SUN, lon1, speed1), _make_pos(Planet.MARS, lon2, speed2),
+            {"degrees_to_exact": degrees_to_exact}, None)
+
+    # Sun at 10° Cancer leaves the sign in 20 days; Mars at 14° Cancer in 32
+    assert perfects(100.0, 1.0, 104.0, 0.5, 4.0)
+    assert not perfects(100.0, 1.0, 104.0, 0.5, 12.0)
+    # A stationary planet sets no limit, and equal speeds never perfect
+    assert perfects(100.0, 0.0005, 119.0, 0.0, 9.0e-4)
+    assert not perfects(100.0, 0.5, 104.0, 0.5, 4.0)
+
+
+def test_timing_description_thresholds():
+    # Each threshold starts the next, coarser description
+    assert [format_timing_description(days) for days in (0.2, 0.5, 1.0, 6.9, 7.0, 29.0, 30.0, 364.0, 365.0)] == [
+        "Within hours", "Within a day", "Within 1 days", "Within 6 days", "Within 1 weeks",
+        "Within 4 weeks", "Within 1 months", "Within 12 months", "More than a year"]
@@ -0,0 +1,43 @@
+import sys
+from pathlib import Path
+
+# Ensure backend package is importable
+BACKEND_DIR = Path(__file__).resolve().parents[1] / 'horary78-main' / 'horary77-main' / 'horary4' / 'backend'
+sys.path.append(str(BACKEND_DIR))
+
+from _horary_math import SOLAR_CAZIMI, SOLAR_COMBUSTION, SOLAR_FREE, SOLAR_UNDER_BEAMS, solar_condition_core
+from calculator import EnhancedTraditionalAstrologicalCalculator
+from models import Planet, Sign, SolarAnalysis, SolarCondition
+
+
+def test_essential_and_accidental_dignity():
+    calc = EnhancedTraditionalAstrologicalCalculator()
+    # Rulership (+5) in an angular house (+1)
+    assert calc._calculate_enhanced_dignity(Planet.MARS, Sign.ARIES, 10) == 6
+    # Fall (-4) in the house of its joy (+2), succedent (0)
+    assert calc._calculate_enhanced_dignity(Planet.VENUS, Sign.VIRGO, 5) == -4 + 2
+    # Detriment (-5) in a cadent house (-1)
+    assert calc._calculate_enhanced_dignity(Planet.VENUS, Sign.SCORPIO, 12) == -5 - 1
+    # Exaltation (+4) and joy (+2) in a cadent house (-1)
+    assert calc._calculate_enhanced_dignity(Planet.SATURN, Sign.LIBRA, 12) == 4 + 2 - 1
+
+
+def test_solar_condition_adjusts_dignity():
+    calc = EnhancedTraditionalAstrologicalCalculator()
+    combust = SolarAnalysis(planet=Planet.MARS, distance_from_sun=3.0,
+                            condition=SolarCondition.COMBUSTION)
+    cazimi = SolarAnalysis(planet=Planet.MARS, distance_from_sun=0.01,
+                           condition=SolarCondition.CAZIMI, exact_cazimi=True)
+    assert calc._calculate_enhanced_dignity(Planet.MARS, Sign.GEMINI, 2, combust) == -10
+    assert calc._calculate_enhanced_dignity(Planet.MARS, Sign.GEMINI, 2, cazimi) == 20
+
+
+def test_solar_condition_core_orb_hierarchy():
+    orbs = (17 / 60, 8.5, 15.0)
+    assert solar_condition_core(100.02, 100.0, *orbs)[1:] == (SOLAR_CAZIMI, True)
+    assert solar_condition_core(100.2, 100.0, *orbs)[1:] == (SOLAR_CAZIMI, False)
+    # Elongation is measured the short way round 0° Aries
+    elongation, code, _ = solar_condition_core(355.0, 3.0, *orbs)
+    assert abs(elongation - 8.0) < 1e-9 and code == SOLAR_COMBUSTION
+    assert solar_condition_core(115.0, 100.0, *orbs)[1] == SOLAR_UNDER_BEAMS
+    assert solar_condition_core(115.1, 100.0, *orbs)[1] == SOLAR_FREE
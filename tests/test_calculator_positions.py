@@ -0,0 +1,131 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Ensure backend package is importable
+BACKEND_DIR = Path(__file__).resolve().parents[1] / 'horary78-main' / 'horary77-main' / 'horary4' / 'backend'
+sys.path.append(str(BACKEND_DIR))
+
+from calculator import EnhancedTraditionalAstrologicalCalculator
+from models import HoraryChart, Planet, PlanetArrays, PlanetPosition, Sign
+
+# Unequal cusps with the 4th house crossing 0° Aries
+HOUSES = [250.0, 280.0, 315.0, 350.0, 20.0, 48.0, 70.0, 100.0, 135.0, 170.0, 200.0, 228.0]
+
+
+def test_get_sign_boundaries():
+    calc = EnhancedTraditionalAstrologicalCalculator()
+    assert calc._get_sign(0.0) == Sign.ARIES
+    assert calc._get_sign(29.999) == Sign.ARIES
+    assert calc._get_sign(30.0) == Sign.TAURUS
+    assert calc._get_sign(359.5) == Sign.PISCES
+    assert calc._get_sign(365.0) == Sign.ARIES
+    assert calc._get_sign(-15.0) == Sign.PISCES
+
+
+def test_house_position_scalar():
+    calc = EnhancedTraditionalAstrologicalCalculator()
+    assert calc._calculate_house_position(250.0, HOUSES) == 1
+    assert calc._calculate_house_position(279.9, HOUSES) == 1
+    assert calc._calculate_house_position(355.0, HOUSES) == 4
+    assert calc._calculate_house_position(5.0, HOUSES) == 4
+    assert calc._calculate_house_position(20.0, HOUSES) == 5
+    assert calc._calculate_house_position(240.0, HOUSES) == 12
+
+
+def test_house_position_array_matches_scalar():
+    calc = EnhancedTraditionalAstrologicalCalculator()
+    longitudes = np.linspace(0.0, 359.5, 720)
+    houses = calc._calculate_house_position(longitudes, HOUSES)
+    assert [int(h) for h in houses] == [calc._calculate_house_position(lon, HOUSES) for lon in longitudes]
+    assert set(int(h) for h in houses) == set(range(1, 13))
+
+
+def test_planet_arrays_round_trip():
+    positions = {
+        Planet.SUN: PlanetPosition(planet=Planet.SUN, longitude=15.5, latitude=0.0, house=10,
+                                   sign=Sign.ARIES, dignity_score=4, speed=0.98),
+        Planet.SATURN: PlanetPosition(planet=Planet.SATURN, longitude=95.0, latitude=1.2, house=1,
+                                      sign=Sign.CANCER, dignity_score=-5, retrograde=True, speed=-0.03),
+    }
+    arrays = PlanetArrays.from_positions(positions)
+    assert arrays.planets == (Planet.SUN, Planet.SATURN)
+    assert list(arrays.sign_idx) == [0, 3]
+    assert list(arrays.lon) == [15.5, 95.0]
+    assert list(arrays.lat) == [0.0, 1.2]
+    assert list(arrays.speed) == [0.98, -0.03]
+    assert list(arrays.house_idx) == [10, 1]
+    assert list(arrays.dignity) == [4, -5]
+
+
+def test_planet_rows_fall_back_per_planet(monkeypatch):
+    import calculator
+    import swisseph as swe
+
+    real_calc = calculator.calc_ut_cached
+
+    def failing_calc(jd_ut, planet_id, *args):
+        if planet_id == swe.MARS:
+            raise RuntimeError("ephemeris file missing")
+        return real_calc(jd_ut, planet_id, *args)
+
+    monkeypatch.setattr(calculator, 'calc_ut_cached', failing_calc)
+    calc = EnhancedTraditionalAstrologicalCalculator()
+    rows = calc._calculate_planet_rows(2451545.0)
+
+    mars = list(calc.planets_swe).index(Planet.MARS)
+    assert np.isnan(rows[mars]).all()
+    assert not np.isnan(np.delete(rows, mars, axis=0)).any()
+
+
+def test_planet_position_from_row():
+    row = (95.0, 1.2, 9.5, -0.03, 0.0, 0.0)
+    pos = PlanetPosition.from_row(Planet.SATURN, row, 3, house=1)
+    assert pos == PlanetPosition(planet=Planet.SATURN, longitude=95.0, latitude=1.2, house=1,
+                                 sign=Sign.CANCER, dignity_score=0, retrograde=True, speed=-0.03)
+
+
+def _house_by_offset(longitude, houses):
+    """Reference rule: the house whose cusp-to-cusp arc contains the longitude"""
+    for i in range(12):
+        width = (houses[(i + 1) % 12] - houses[i]) % 360.0
+        if (longitude - houses[i]) % 360.0 < width:
+            return i + 1
+
+
+def test_house_position_matches_offset_rule_on_cusps():
+    calc = EnhancedTraditionalAstrologicalCalculator()
+    longitudes = HOUSES + [cusp - 1e-9 for cusp in HOUSES] + [0.0, 359.999, 370.0, -10.0]
+    for lon in longitudes:
+        assert calc._calculate_house_position(lon, HOUSES) == _house_by_offset(lon, HOUSES)
+
+
+def test_chart_houses_array_feeds_house_lookup():
+    chart = HoraryChart(date_time=None, date_time_utc=None, timezone_info='UTC', location=(0.0, 0.0),
+                        location_name='', planets={}, aspects=[], houses=HOUSES, house_rulers={},
+                        ascendant=HOUSES[0], midheaven=HOUSES[9])
+    assert chart.houses_arr.dtype == np.float64 and chart.houses_arr.flags.c_contiguous
+    assert list(chart.houses_arr) == HOUSES
+
+    calc = EnhancedTraditionalAstrologicalCalculator()
+    longitudes = np.linspace(0.0, 359.5, 72)
+    assert (calc._calculate_house_position(longitudes, chart.houses_arr) ==
+            calc._calculate_house_position(longitudes, HOUSES)).all()
+
+
+def test_chart_derives_moon_and_ascendant_scalars():
+    planets = {
+        Planet.SUN: PlanetPosition(planet=Planet.SUN, longitude=350.0, latitude=0.0, house=4,
+                                   sign=Sign.PISCES, dignity_score=0, speed=1.0),
+        Planet.MOON: PlanetPosition(planet=Planet.MOON, longitude=40.5, latitude=0.0, house=5,
+                                    sign=Sign.TAURUS, dignity_score=0, speed=-12.5),
+    }
+    chart = HoraryChart(date_time=None, date_time_utc=None, timezone_info='UTC', location=(0.0, 0.0),
+                        location_name='', planets=planets, aspects=[], houses=HOUSES, house_rulers={},
+                        ascendant=HOUSES[0], midheaven=HOUSES[9])
+    assert chart.moon_sun_elongation == 50.5
+    assert chart.moon_deg_in_sign == 10.5
+    assert chart.moon_speed_abs == 12.5
+    assert chart.asc_deg_in_sign == 10.0
+    assert chart.moon is planets[Planet.MOON] and chart.sun is planets[Planet.SUN]
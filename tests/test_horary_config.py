@@ -22,6 +22,17 @@ def test_load_default_config_and_access_known_key(monkeypatch):
     assert cfg.get("timing.default_moon_speed_fallback") == 13.0
 
 
+def test_get_matches_namespace_paths(monkeypatch):
+    monkeypatch.delenv('HORARY_CONFIG', raising=False)
+    HoraryConfig.reset()
+    cfg = HoraryConfig()
+    assert cfg.get("orbs") is cfg.config.orbs
+    assert cfg.get("confidence.lunar_confidence_caps.favorable") == cfg.config.confidence.lunar_confidence_caps.favorable
+    assert cfg.get("orbs.no_such_orb", 5.0) == 5.0
+    with pytest.raises(HoraryError):
+        cfg.get("orbs.conjunction.too_deep")
+
+
 def test_validate_required_keys_missing(monkeypatch, tmp_path):
     config_content = textwrap.dedent(
         """
@@ -57,3 +68,18 @@ def test_invalid_yaml_raises_error(monkeypatch, tmp_path):
     HoraryConfig.reset()
     with pytest.raises(HoraryError):
         HoraryConfig()
+
+
+def test_validation_is_remembered_until_reset(monkeypatch):
+    monkeypatch.delenv('HORARY_CONFIG', raising=False)
+    HoraryConfig.reset()
+    cfg = HoraryConfig()
+    cfg.validate_required_keys()
+
+    calls = []
+    monkeypatch.setattr(cfg, 'require', lambda key: calls.append(key))
+    cfg.validate_required_keys()
+    assert calls == []
+
+    HoraryConfig.reset()
+    assert HoraryConfig()._validated_config is None
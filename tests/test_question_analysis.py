@@ -1,6 +1,8 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add backend module path for importing TraditionalHoraryQuestionAnalyzer
 BASE_DIR = Path(__file__).resolve().parent.parent
 sys.path.append(str(BASE_DIR / "horary78-main" / "horary77-main" / "horary4" / "backend"))
@@ -47,3 +49,39 @@ def test_ill_relative_analysis():
             "saturn": "chronic illness",
         },
     }
+
+def test_question_type_follows_pattern_priority():
+    # "sick" (health) comes first in the text, but marriage is checked first
+    assert analyzer.analyze_question("Is my sick wife going to recover?")["question_type"] == "marriage"
+    # Keywords match inside words, as with substring tests: "ill" in "will"
+    assert analyzer.analyze_question("What will happen?")["question_type"] == "health"
+    assert analyzer.analyze_question("Should I wait?")["question_type"] == "general"
+
+def test_repeat_analysis_is_cached_but_not_shared():
+    first = analyzer.analyze_question("Will I marry soon?")
+    first["significators"]["quesited_house"] = 5
+    first["significators"]["special_significators"].clear()
+    first["relevant_houses"].append(9)
+
+    again = analyzer.analyze_question("  WILL I MARRY SOON?")
+    assert again["relevant_houses"] == [1, 7]
+    assert again["significators"]["quesited_house"] == 7
+    assert "venus" in again["significators"]["special_significators"]
+    assert analyzer._analyze_cached.cache_info().hits >= 1
+
+def test_category_scan_sees_keywords_sharing_a_start():
+    bits = analyzer._category_bits
+    # "illness" is matched at its start, which must also count "ill" and "illness"
+    mask = analyzer._category_mask("is the illness serious?")
+    assert mask & bits["illness"] and mask & bits[("house", 6)]
+    # "spouse" is a person, a theme and a house meaning at once
+    mask = analyzer._category_mask("my spouse")
+    assert mask & bits[("person", 7)] and mask & bits["spouse"] and mask & bits[("house", 7)]
+    assert not mask & bits["death"]
+
+def test_keyword_tables_are_shared_and_read_only():
+    other = TraditionalHoraryQuestionAnalyzer()
+    assert other.house_meanings is analyzer.house_meanings
+    assert other._category_scanner is analyzer._category_scanner
+    with pytest.raises(TypeError):
+        other.person_keywords[4] = ("uncle",)
@@ -1,6 +1,7 @@
 import sys
 import datetime
 from pathlib import Path
+import numpy as np
 import pytz
 import pytest
 
@@ -28,6 +29,17 @@ def test_ambiguous_fall_back_time(monkeypatch):
     assert (utc_dt.hour, utc_dt.minute) == (6, 30)
 
 
+def test_zoneinfo_resolves_transitions_like_pytz():
+    tm = TimezoneManager()
+    # Fall back: the repeated 01:30 is read in standard time, as on the pytz path
+    local_dt, utc_dt, _ = tm.parse_datetime_with_timezone('2021-11-07', '01:30', 'America/New_York')
+    assert local_dt.utcoffset() == datetime.timedelta(hours=-5)
+    assert (utc_dt.hour, utc_dt.minute) == (6, 30)
+    # Outside transitions the wall time is attached unchanged
+    local_dt, _, _ = tm.parse_datetime_with_timezone('2021-07-01', '01:30', 'America/New_York')
+    assert local_dt.fold == 0 and local_dt.utcoffset() == datetime.timedelta(hours=-4)
+
+
 def test_nonexistent_spring_forward_adjustment(monkeypatch):
     # Force use of pytz and simulate NonExistentTimeError
     monkeypatch.setattr(judgment_engine, 'ZoneInfo', None)
@@ -61,3 +73,60 @@ def test_roundtrip_local_to_utc(monkeypatch):
     assert tz_used == 'America/New_York'
     assert local_dt.utcoffset() == datetime.timedelta(hours=-4)
     assert utc_dt == local_dt.astimezone(pytz.UTC)
+
+
+def test_timezone_lookup_cached_on_rounded_coordinates():
+    tm = TimezoneManager()
+    assert tm.get_timezone_for_location(NY_LAT, NY_LON) == 'America/New_York'
+    assert tm.get_timezone_for_location(NY_LAT + 1e-5, NY_LON - 1e-5) == 'America/New_York'
+    info = tm._timezone_at.cache_info()
+    assert (info.hits, info.misses) == (1, 1)
+
+
+def test_timezone_objects_are_memoized():
+    assert judgment_engine._get_tz('Europe/London') is judgment_engine._get_tz('Europe/London')
+    tm = TimezoneManager()
+    local_dt, utc_dt, tz_used = tm.parse_datetime_with_timezone(
+        '2021-06-01', '12:00', timezone_str='Not/AZone'
+    )
+    assert tz_used == 'UTC'
+    assert local_dt == utc_dt
+
+
+def test_parse_many_matches_per_call_parsing():
+    tm = TimezoneManager()
+    dates = ['2021-11-07', '2021-11-07', '2021-03-14', '2021-03-14', '2021-06-01', '1999-12-31']
+    times = ['00:30', '01:30', '02:30', '03:30', '12:00', '23:59']
+    local, utc, tz_used = tm.parse_many(dates, times, lat=NY_LAT, lon=NY_LON)
+    assert tz_used == 'America/New_York'
+    for i, (date, time) in enumerate(zip(dates, times)):
+        local_dt, utc_dt, _ = tm.parse_datetime_with_timezone(date, time, 'America/New_York')
+        assert local[i] == np.datetime64(local_dt.replace(tzinfo=None))
+        assert utc[i] == np.datetime64(utc_dt.replace(tzinfo=None))
+
+    _, utc, tz_used = tm.parse_many(dates, times, timezone_str='Not/AZone')
+    assert tz_used == 'UTC'
+    assert (utc == np.array([f"{d}T{t}" for d, t in zip(dates, times)], dtype='datetime64[s]')).all()
+
+
+def test_parse_date_time_matches_strptime():
+    parse = judgment_engine._parse_date_time
+    assert parse('2021-11-07', '01:30') == datetime.datetime(2021, 11, 7, 1, 30)
+    # Non-padded fields still go through strptime
+    assert parse('2021-6-1', '9:05') == datetime.datetime(2021, 6, 1, 9, 5)
+    for date, time in [('2021-02-29', '12:00'), ('2021-06-01', '24:00'), ('2021-06-01', '1230')]:
+        with pytest.raises(ValueError):
+            parse(date, time)
+
+
+def test_parse_many_localizes_without_transition_table(monkeypatch):
+    tm = TimezoneManager()
+    dates = ['2021-11-07', '2021-11-07', '2021-03-14', '2021-06-01']
+    times = ['01:30', '02:30', '02:30', '12:00']
+    expected = tm.parse_many(dates, times, 'America/New_York')
+
+    # A pytz build without the private transition attributes
+    monkeypatch.setattr(judgment_engine, '_transition_table', lambda tz_str: None)
+    local, utc, tz_used = tm.parse_many(dates, times, 'America/New_York')
+    assert tz_used == 'America/New_York'
+    assert (local == expected[0]).all() and (utc == expected[1]).all()